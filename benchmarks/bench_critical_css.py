@@ -0,0 +1,63 @@
+"""
+Bytes needed before the landing page's first render: linked stylesheet vs inlined critical CSS.
+
+The first render waits for the HTML and every render-blocking stylesheet, so the report counts both,
+raw and gzipped (roughly what goes over the wire).
+
+Usage: python benchmarks/bench_critical_css.py [--minify]
+"""
+
+import argparse
+import gzip
+import re
+import tempfile
+from pathlib import Path
+
+from jarvis.landing import LandingWriter
+from jarvis.mirror import MirrorMode
+
+DOCS_DIR = Path(__file__).parent.parent / "docs"
+_BLOCKING_STYLESHEET = re.compile(r'<link rel="stylesheet" href="(_landing/[^"]+)"')
+
+
+def render(output_dir: Path, cache_dir: Path, minify: bool, critical_css: bool) -> tuple[bytes, list[bytes]]:
+    """The landing page and the local stylesheets it blocks on, outside of <noscript>."""
+    LandingWriter(
+        DOCS_DIR / "presentations.json",
+        DOCS_DIR / "presentations",
+        DOCS_DIR / "teaching.json",
+        DOCS_DIR / "notebooks",
+        DOCS_DIR / "blogs",
+        output_dir,
+        mirror_mode=MirrorMode.HARDLINK,
+        cache_dir=cache_dir,
+        minify=minify,
+        critical_css=critical_css,
+    ).write()
+    html = (output_dir / "index.html").read_bytes()
+    head = re.sub(r"<noscript>.*?</noscript>", "", html.decode().split("</head>", 1)[0], flags=re.DOTALL)
+    return html, [(output_dir / href).read_bytes() for href in _BLOCKING_STYLESHEET.findall(head)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minify", action="store_true", help="Minify the page and the stylesheet, as the site build does.")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp) / "cache"
+        for label, critical_css in (("linked stylesheet", False), ("critical CSS inlined", True)):
+            html, stylesheets = render(Path(tmp) / label.replace(" ", "-"), cache_dir, args.minify, critical_css)
+            raw = len(html) + sum(len(s) for s in stylesheets)
+            gzipped = len(gzip.compress(html)) + sum(len(gzip.compress(s)) for s in stylesheets)
+            rows.append((label, len(stylesheets), len(html), raw, gzipped))
+
+    print(f"landing page first render{' (minified)' if args.minify else ''}\n")
+    print(f"{'':<22} {'blocking CSS':>12} {'HTML [B]':>10} {'first render [B]':>17} {'gzipped [B]':>12}")
+    for label, requests, html_bytes, raw, gzipped in rows:
+        print(f"{label:<22} {requests:>12} {html_bytes:>10,} {raw:>17,} {gzipped:>12,}")
+
+
+if __name__ == "__main__":
+    main()
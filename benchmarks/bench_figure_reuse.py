@@ -0,0 +1,103 @@
+"""
+Cost of a slider change in the notebook plots: a new pyplot axes per re-run vs the notebooks' FigureCache.
+
+Replays the cubic plot of the linear_functions notebook for a sequence of coefficient changes, rendering each
+update to PNG as marimo does, and reports the time per update and the memory still held afterwards.
+
+Usage: python benchmarks/bench_figure_reuse.py [--updates 20]
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+from jarvis.notebooks.linear_functions import app
+
+
+def pyplot_per_update(polynomial_curve: Callable, coefficients: tuple[float, ...]) -> object:
+    """What the plot cell did before: a fresh pyplot axes on every re-run."""
+    plt.axes()
+    x, y = polynomial_curve(coefficients, -100, 100)
+    plt.plot(x, y)
+    plt.title("Function Plot")
+    plt.xlabel("x")
+    plt.ylabel("f(x)")
+    plt.grid()
+    plt.xlim(-100, 100)
+    plt.ylim(-100, 100)
+    plt.axhline(0, color="black", lw=0.5, ls="--")
+    plt.axvline(0, color="black", lw=0.5, ls="--")
+    return plt.gcf()
+
+
+def cached_update(figures: object, polynomial_curve: Callable, coefficients: tuple[float, ...]) -> object:
+    def build(figure: matplotlib.figure.Figure) -> object:
+        ax = figure.add_subplot()
+        (line,) = ax.plot([], [])
+        ax.set_title("Function Plot")
+        ax.set_xlabel("x")
+        ax.set_ylabel("f(x)")
+        ax.grid()
+        ax.set_xlim(-100, 100)
+        ax.set_ylim(-100, 100)
+        ax.axhline(0, color="black", lw=0.5, ls="--")
+        ax.axvline(0, color="black", lw=0.5, ls="--")
+        return line
+
+    figure, line = figures.get("polynomial", build)  # type: ignore[attr-defined]
+    line.set_data(*polynomial_curve(coefficients, -100, 100))
+    return figure
+
+
+def measure(update: Callable[[tuple[float, ...]], object], updates: int) -> tuple[float, float]:
+    """
+    Milliseconds per update, including the PNG render, and MB still allocated after another round of updates.
+
+    Memory is traced in a separate round without rendering, because tracing slows matplotlib down severalfold.
+    """
+    start = time.perf_counter()
+    for i in range(updates):
+        update(_coefficients(i)).savefig(io.BytesIO(), format="png")  # type: ignore[attr-defined]
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    for i in range(updates):
+        update(_coefficients(i))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / updates * 1000, current / 1e6
+
+
+def _coefficients(i: int) -> tuple[float, ...]:
+    return (0.0001 * i, -0.01 * i, 0.1 * i, float(i))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--updates", type=int, default=20)
+    args = parser.parse_args()
+    _, defs = app.run()
+    polynomial_curve, figure_cache = defs["polynomial_curve"], defs["FigureCache"]
+
+    rows = [
+        ("pyplot axes per update", *measure(lambda c: pyplot_per_update(polynomial_curve, c), args.updates), len(plt.get_fignums())),
+    ]
+    plt.close("all")
+    figures = figure_cache()
+    rows.append(("FigureCache, set_data", *measure(lambda c: cached_update(figures, polynomial_curve, c), args.updates), len(plt.get_fignums())))
+
+    print(f"{args.updates} updates of the cubic plot, each rendered to PNG\n")
+    print(f"{'':<24} {'ms/update':>10} {'MB held':>9} {'pyplot figures':>15}")
+    for label, ms, mb, open_figures in rows:
+        print(f"{label:<24} {ms:>10.1f} {mb:>9.1f} {open_figures:>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare blog frontmatter parsing strategies on a synthetic corpus.
+
+Usage: python benchmarks/bench_frontmatter.py [--posts 10000]
+"""
+
+import argparse
+import base64
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from jarvis.writing import FrontmatterIndex, _read_frontmatter, scan_blogs
+
+
+def legacy_parse_frontmatter(text: str) -> dict[str, str]:
+    """The original implementation: split the whole file, then look for the closing marker."""
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}
+    fm: dict[str, str] = {}
+    for line in lines[1:]:
+        if line.strip() == "---":
+            break
+        if ":" in line:
+            k, _, v = line.partition(":")
+            fm[k.strip()] = v.strip()
+    return fm
+
+
+def make_corpus(root: Path, posts: int) -> int:
+    """Write ``posts`` posts; every tenth one embeds a large code listing and a base64 image. Returns total bytes."""
+    rng = random.Random(42)  # noqa: S311
+    image = base64.b64encode(rng.randbytes(200_000)).decode()
+    listing = "\n".join(f"    result_{i} = compute(value_{i}, factor={i})" for i in range(2_000))
+    total = 0
+    for i in range(posts):
+        year_dir = root / str(2000 + i % 26)
+        year_dir.mkdir(parents=True, exist_ok=True)
+        body = f"# Post {i}\n\nSome prose.\n"
+        if i % 10 == 0:
+            body += f"\n```python\n{listing}\n```\n\n![img](data:image/png;base64,{image})\n"
+        text = f"---\ntags: python, build\ncategory: learning\ndate: {2000 + i % 26}-{1 + i % 12:02d}-{1 + i % 28:02d}\ntitle: Post {i}\n---\n\n{body}"
+        (year_dir / f"post_{i}.md").write_text(text)
+        total += len(text)
+    return total
+
+
+def timed(label: str, func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed * 1000:9.1f} ms")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blogs = Path(tmp) / "blogs"
+        total = make_corpus(blogs, args.posts)
+        paths = sorted(blogs.rglob("*.md"))
+        print(f"corpus: {len(paths)} posts, {total / 1e6:.1f} MB\n")
+
+        legacy = timed("legacy read_text + splitlines", lambda: [legacy_parse_frontmatter(p.read_text()) for p in paths])
+        streaming = timed("streaming _read_frontmatter", lambda: [_read_frontmatter(p) for p in paths])
+        index_file = Path(tmp) / "frontmatter.json"
+        timed("scan_blogs, cold index", lambda: scan_blogs(blogs, index=FrontmatterIndex(index_file)))
+        timed("scan_blogs, warm index", lambda: scan_blogs(blogs, index=FrontmatterIndex(index_file)))
+        print(f"\nstreaming speedup over legacy: {legacy / streaming:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
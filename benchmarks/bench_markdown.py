@@ -0,0 +1,57 @@
+"""
+Per-call cost of rendering markdown: module-level markdown.markdown() vs the pooled MarkdownRenderer.
+
+Usage: python benchmarks/bench_markdown.py [--entries 500] [--rounds 5]
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import markdown
+
+from jarvis._md import MarkdownRenderer
+
+DOCS_DIR = Path(__file__).parent.parent / "docs"
+
+
+def load_snippets(entries: int) -> list[str]:
+    """Timeline titles and descriptions, repeated with a suffix until there are ``entries`` distinct snippets."""
+    timeline = json.loads((DOCS_DIR / "timeline.json").read_text())["entries"]
+    base = [e["title"] for e in timeline] + [e["description"] for e in timeline]
+    return [f"{base[i % len(base)]} ({i})" for i in range(entries)]
+
+
+def per_call_us(func: Callable[[str], object], snippets: list[str], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in snippets:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(snippets) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    snippets = load_snippets(args.entries)
+
+    renderer = MarkdownRenderer()
+    rows = [
+        ("markdown.markdown() per call", per_call_us(markdown.markdown, snippets, args.rounds)),
+        ("MarkdownRenderer.render (pooled)", per_call_us(renderer.render, snippets, args.rounds)),
+        ("MarkdownRenderer.render_inline (cached)", per_call_us(renderer.render_inline, snippets, args.rounds)),
+    ]
+    baseline = rows[0][1]
+    print(f"{len(snippets)} snippets, best of {args.rounds} rounds\n")
+    for label, us in rows:
+        print(f"{label:<42} {us:8.1f} us/call  {baseline / us:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,70 @@
-"""Small markdown helpers shared by the jarvis page writers."""
+"""Markdown rendering shared by the jarvis page writers and the template ``md`` filter."""
 
+import queue
 import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache, lru_cache
 
 import markdown as md
 from markupsafe import Markup
 
 _WRAPPING_P = re.compile(r"^<p>(.*)</p>$", re.DOTALL)
 
+DEFAULT_EXTENSIONS: tuple[str, ...] = ()
+
+
+class MarkdownRenderer:
+    """
+    Render markdown with a fixed extension set, reusing a pool of configured ``Markdown`` instances.
+
+    Building a ``Markdown`` object loads the extensions and compiles their regexes, which dominates the cost of
+    rendering short snippets. Instances are not thread-safe, so each call borrows one from the pool and resets it.
+    """
+
+    def __init__(self, extensions: tuple[str, ...] = DEFAULT_EXTENSIONS, pool_size: int = 4, inline_cache_size: int = 1024) -> None:
+        self.extensions = extensions
+        self._pool: queue.Queue[md.Markdown] = queue.Queue(maxsize=pool_size)
+        # Wrapped per renderer rather than decorating the method, so each renderer has its own cache.
+        # ``render_inline.cache_info()`` reports the hit/miss counters.
+        self.render_inline = lru_cache(maxsize=inline_cache_size)(self._render_inline)
+
+    @contextmanager
+    def _instance(self) -> Iterator[md.Markdown]:
+        try:
+            instance = self._pool.get_nowait()
+        except queue.Empty:
+            instance = md.Markdown(extensions=list(self.extensions))
+        try:
+            yield instance.reset()
+        finally:
+            try:
+                self._pool.put_nowait(instance)
+            except queue.Full:
+                pass
+
+    def render(self, text: str) -> Markup:
+        with self._instance() as instance:
+            html = instance.convert(text)
+        # Inputs are project-owned files (about.md, timeline, presentations, teaching) — no XSS risk.
+        return Markup(html)  # noqa: S704
+
+    def _render_inline(self, text: str) -> Markup:
+        """Render inline markdown, stripping the wrapping <p> tag for single-paragraph input."""
+        with self._instance() as instance:
+            html = instance.convert(text).strip()
+        m = _WRAPPING_P.match(html)
+        if m:
+            html = m.group(1)
+        return Markup(html)  # noqa: S704
+
+
+@cache
+def get_renderer(extensions: tuple[str, ...] = DEFAULT_EXTENSIONS) -> MarkdownRenderer:
+    """Return the process-wide renderer for ``extensions``."""
+    return MarkdownRenderer(extensions)
+
 
 def render_md_inline(text: str) -> Markup:
-    """Render inline markdown, stripping the wrapping <p> tag for single-paragraph input."""
-    html = md.markdown(text).strip()
-    m = _WRAPPING_P.match(html)
-    if m:
-        html = m.group(1)
-    # Inputs come from project-owned JSON files (timeline, presentations, teaching) — no XSS risk.
-    return Markup(html)  # noqa: S704
+    """Render inline markdown with the default renderer (memoised, see ``MarkdownRenderer.render_inline``)."""
+    return get_renderer().render_inline(text)
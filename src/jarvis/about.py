@@ -3,11 +3,15 @@
 from dataclasses import dataclass
 from pathlib import Path
 
-import markdown as md
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment
 from markupsafe import Markup
+from py_app_dev.core.logging import logger
 
-from jarvis._md import render_md_inline
+from jarvis._md import DEFAULT_EXTENSIONS, get_renderer
+from jarvis.assets import ASSETS_URL, MANIFEST_NAME, AssetSource, PublishedAssets
+from jarvis.deps import expand_sources, template_files
+from jarvis.minify import PageSize, write_minified
+from jarvis.templating import get_environment
 from jarvis.timeline import Timeline
 
 
@@ -17,7 +21,7 @@ class About:
     body_html: Markup
 
 
-def parse_about_md(text: str) -> About:
+def parse_about_md(text: str, markdown_extensions: tuple[str, ...] = DEFAULT_EXTENSIONS) -> About:
     """
     Extract the H1 title and bio paragraphs, dropping anything from the first H2 onward.
 
@@ -39,9 +43,7 @@ def parse_about_md(text: str) -> About:
             break
         body_lines.append(line)
     body_md = "\n".join(body_lines).strip()
-    # about.md is project-owned content — no XSS risk.
-    body_html = Markup(md.markdown(body_md))  # noqa: S704
-    return About(title=title, body_html=body_html)
+    return About(title=title, body_html=get_renderer(markdown_extensions).render(body_md))
 
 
 class AboutWriter:
@@ -51,28 +53,56 @@ class AboutWriter:
         timeline_file: Path,
         output_dir: Path,
         templates_dir: Path | None = None,
+        cache_dir: Path | None = None,
+        markdown_extensions: tuple[str, ...] = DEFAULT_EXTENSIONS,
+        minify: bool = False,
+        assets: AssetSource | None = None,
     ) -> None:
         self.about_md_file = about_md_file
         self.timeline_file = timeline_file
         self.output_dir = output_dir
         self.templates_dir = templates_dir or Path(__file__).parent / "templates" / "about"
+        self.cache_dir = cache_dir
+        self.markdown_extensions = markdown_extensions
+        self.minify = minify
+        # The landing writer publishes the assets; the about page only links them by their fingerprinted names,
+        # taken from the landing writer itself or, by default, from the manifest it wrote to the output.
+        self.assets = assets or PublishedAssets(output_dir / ASSETS_URL / MANIFEST_NAME)
+        self.page_sizes: list[PageSize] = []
+
+    @property
+    def env(self) -> Environment:
+        return get_environment(self.templates_dir.parent, self.cache_dir, self.markdown_extensions)
+
+    @property
+    def template_name(self) -> str:
+        return f"{self.templates_dir.name}/index.html.j2"
+
+    def sources(self) -> list[Path]:
+        return [self.about_md_file, self.timeline_file, *self.assets.asset_sources()]
+
+    def inputs(self) -> list[Path]:
+        return [*expand_sources(self.sources()), *template_files(self.env, self.template_name)]
+
+    def outputs(self) -> list[Path]:
+        return [self.output_dir / "about.html"]
 
     def write(self) -> None:
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        about = parse_about_md(self.about_md_file.read_text())
+        about = parse_about_md(self.about_md_file.read_text(), self.markdown_extensions)
         timeline = Timeline.from_json_file(self.timeline_file)
 
-        env = Environment(
-            loader=FileSystemLoader([str(self.templates_dir), str(self.templates_dir.parent)]),
-            autoescape=select_autoescape(["html"]),
-        )
-        env.filters["md"] = render_md_inline
-
-        tmpl = env.get_template("index.html.j2")
+        tmpl = self.env.get_template(self.template_name)
         html = tmpl.render(
+            asset_url=self.assets.asset_manifest().url,
             title=about.title,
             body_html=about.body_html,
             timeline_entries=timeline.entries,
         )
-        (self.output_dir / "about.html").write_text(html)
+        if self.minify:
+            self.page_sizes = [write_minified(self.output_dir / "about.html", html)]
+            logger.info(self.page_sizes[0].summary())
+        else:
+            (self.output_dir / "about.html").write_text(html)
+        logger.debug(f"inline markdown cache: {get_renderer(self.markdown_extensions).render_inline.cache_info()}")
@@ -0,0 +1,95 @@
+"""Content-hashed (fingerprinted) names for the landing assets, so they can be served with immutable cache headers."""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Protocol
+
+from py_app_dev.core.exceptions import UserNotificationException
+
+from jarvis.files import file_digest, files_under
+from jarvis.minify import minify_css
+
+ASSETS_DIR = Path(__file__).parent / "templates" / "landing" / "assets"
+# Directory of the assets below the output root, as used in URLs.
+ASSETS_URL = "_landing"
+MANIFEST_NAME = "asset-manifest.json"
+HASH_LENGTH = 10
+
+
+def fingerprinted_name(name: str, digest: str) -> str:
+    """``css/landing.css`` -> ``css/landing.<digest>.css``."""
+    path = PurePosixPath(name)
+    return str(path.with_name(f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix}"))
+
+
+@dataclass
+class Asset:
+    source: Path
+    name: str  # fingerprinted path, relative to the assets directory
+    content: bytes | None = None  # minified content to write; None to copy the source as-is
+
+
+class AssetManifest:
+    """Logical asset names (``landing.css``) mapped to their fingerprinted files."""
+
+    def __init__(self, assets: dict[str, Asset]) -> None:
+        self.assets = assets
+
+    @classmethod
+    def from_dir(cls, assets_dir: Path = ASSETS_DIR, minify: bool = False) -> "AssetManifest":
+        """
+        Fingerprint every file below ``assets_dir`` by the content that will be served.
+
+        With ``minify`` the stylesheets are served minified, so they are hashed (and cached here) minified.
+        """
+        assets = {}
+        for source in files_under(assets_dir) if assets_dir.exists() else []:
+            name = source.relative_to(assets_dir).as_posix()
+            if minify and source.suffix == ".css":
+                content = minify_css(source.read_text()).encode()
+                assets[name] = Asset(source, fingerprinted_name(name, hashlib.sha256(content).hexdigest()), content)
+            else:
+                assets[name] = Asset(source, fingerprinted_name(name, file_digest(source)))
+        return cls(assets)
+
+    def url(self, name: str) -> str:
+        """URL of the fingerprinted asset, relative to the output root; the ``asset_url`` template helper."""
+        if name not in self.assets:
+            raise UserNotificationException(f"Unknown asset '{name}', expected one of: {', '.join(sorted(self.assets))}")
+        return f"{ASSETS_URL}/{self.assets[name].name}"
+
+    def to_json(self) -> str:
+        return json.dumps({name: self.url(name) for name in sorted(self.assets)}, indent=2) + "\n"
+
+    @classmethod
+    def load(cls, path: Path) -> "AssetManifest":
+        """Read a manifest written by ``to_json``; the assets' sources are the published files next to it."""
+        try:
+            urls = json.loads(path.read_text())
+        except FileNotFoundError:
+            raise UserNotificationException(f"Asset manifest {path} not found, generate the landing page first") from None
+        names = {name: str(PurePosixPath(url).relative_to(ASSETS_URL)) for name, url in urls.items()}
+        return cls({name: Asset(path.parent / fingerprinted, fingerprinted) for name, fingerprinted in names.items()})
+
+
+class AssetSource(Protocol):
+    """Where a page gets the fingerprinted landing assets it links."""
+
+    def asset_manifest(self) -> AssetManifest: ...
+
+    def asset_sources(self) -> list[Path]: ...
+
+
+class PublishedAssets:
+    """The assets as the landing page published them, read back from its ``asset-manifest.json``."""
+
+    def __init__(self, manifest: Path) -> None:
+        self.manifest = manifest
+
+    def asset_manifest(self) -> AssetManifest:
+        return AssetManifest.load(self.manifest)
+
+    def asset_sources(self) -> list[Path]:
+        return [self.manifest]
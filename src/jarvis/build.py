@@ -0,0 +1,149 @@
+"""Incremental site build: skip page writers whose inputs and outputs are unchanged since the last run."""
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Protocol
+
+from py_app_dev.core.logging import logger, time_it
+
+from jarvis.files import file_digest
+
+
+class PageWriter(Protocol):
+    def inputs(self) -> list[Path]: ...
+
+    def outputs(self) -> list[Path]: ...
+
+    def write(self) -> None: ...
+
+
+@dataclass
+class FileRecord:
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+@dataclass
+class StepRecord:
+    inputs_digest: str
+    # output path -> [size, mtime_ns]; detects outputs overwritten or deleted by other tools (e.g. Sphinx).
+    outputs: dict[str, list[int]] = field(default_factory=dict)
+
+
+class BuildManifest:
+    """
+    Content hashes of the build inputs and stat signatures of the outputs, persisted between runs.
+
+    File digests are cached by size + mtime, so a no-op rebuild only stats files and never re-reads them.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._files: dict[str, FileRecord] = {}
+        self._steps: dict[str, StepRecord] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != self.VERSION:
+                return
+            self._files = {k: FileRecord(*v) for k, v in data["files"].items()}
+            self._steps = {k: StepRecord(**v) for k, v in data["steps"].items()}
+        except (ValueError, KeyError, TypeError):
+            # A corrupt manifest only costs a full rebuild.
+            logger.warning(f"Ignoring unreadable build manifest {self.path}")
+            self._files, self._steps = {}, {}
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": self.VERSION,
+            "files": {k: [r.size, r.mtime_ns, r.digest] for k, r in self._files.items()},
+            "steps": {k: {"inputs_digest": r.inputs_digest, "outputs": r.outputs} for k, r in self._steps.items()},
+        }
+        self.path.write_text(json.dumps(data, indent=1))
+
+    def digest(self, path: Path) -> str | None:
+        """Content digest of ``path``, re-hashing only when its size or mtime changed. None if missing."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        key = str(path)
+        record = self._files.get(key)
+        if record is None or record.size != st.st_size or record.mtime_ns != st.st_mtime_ns:
+            record = FileRecord(st.st_size, st.st_mtime_ns, file_digest(path))
+            self._files[key] = record
+        return record.digest
+
+    def inputs_digest(self, inputs: list[Path], settings: str = "") -> str:
+        """Digest of the inputs' paths and contents, and of the ``settings`` that shape the output (e.g. minification)."""
+        h = hashlib.sha256(f"{settings}\n".encode())
+        for path in inputs:
+            h.update(f"{path}\0{self.digest(path) or '-'}\n".encode())
+        return h.hexdigest()
+
+    @staticmethod
+    def _stat_outputs(outputs: list[Path]) -> dict[str, list[int]]:
+        result: dict[str, list[int]] = {}
+        for path in outputs:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            result[str(path)] = [st.st_size, st.st_mtime_ns]
+        return result
+
+    def is_up_to_date(self, name: str, writer: PageWriter, settings: str = "") -> bool:
+        record = self._steps.get(name)
+        if record is None or record.inputs_digest != self.inputs_digest(writer.inputs(), settings):
+            return False
+        outputs = writer.outputs()
+        return len(record.outputs) == len(outputs) and record.outputs == self._stat_outputs(outputs)
+
+    def record(self, name: str, writer: PageWriter, settings: str = "") -> None:
+        self._steps[name] = StepRecord(self.inputs_digest(writer.inputs(), settings), self._stat_outputs(writer.outputs()))
+
+
+class IncrementalBuilder:
+    def __init__(self, manifest: BuildManifest, force: bool = False, settings: str = "") -> None:
+        self.manifest = manifest
+        self.force = force
+        # Build options that change the output without changing any input; a different value rebuilds every page.
+        self.settings = settings
+
+    def run(self, name: str, writer: PageWriter) -> bool:
+        """Write the page unless the manifest proves it is up to date. Returns True if it was written."""
+        if not self.force and self.manifest.is_up_to_date(name, writer, self.settings):
+            logger.info(f"{name}: up to date, skipped")
+            return False
+        writer.write()
+        self.manifest.record(name, writer, self.settings)
+        return True
+
+    def run_all(self, writers: dict[str, PageWriter], parallel: bool = False) -> list[str]:
+        """
+        Run every writer in this process, timing each one. Returns the names of the writers that wrote.
+
+        With ``parallel`` the writers run concurrently on threads; they share the template environment and the
+        manifest's digest cache, and spend most of their time in file I/O.
+        """
+
+        def run_one(name: str) -> bool:
+            return time_it(name)(self.run)(name, writers[name])
+
+        if parallel and len(writers) > 1:
+            with ThreadPoolExecutor(max_workers=len(writers)) as pool:
+                written = list(pool.map(run_one, writers))
+        else:
+            written = [run_one(name) for name in writers]
+        return [name for name, was_written in zip(writers, written, strict=True) if was_written]
@@ -0,0 +1,133 @@
+"""Write precompressed ``.gz`` and ``.br`` siblings of the site's text assets, so the host serves them as-is."""
+
+import gzip
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import brotli
+
+from jarvis.files import files_under
+
+COMPRESSIBLE_SUFFIXES = frozenset({".html", ".css", ".js", ".mjs", ".json", ".map", ".svg", ".xml", ".txt", ".csv", ".webmanifest", ".wasm"})
+# Below this, the response headers outweigh any saving.
+MIN_SIZE = 512
+FORMATS = ("gz", "br")
+
+
+@dataclass
+class CompressStats:
+    files: int = 0  # compressed siblings written
+    skipped: int = 0  # files whose siblings are newer than them, or known not to be worth writing
+    source_bytes: int = 0
+    compressed_bytes: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        ratio = self.compressed_bytes / self.source_bytes if self.source_bytes else 1.0
+        return (
+            f"precompressed {self.files} files ({self.source_bytes / 1e6:.1f} MB -> {self.compressed_bytes / 1e6:.1f} MB, "
+            f"{ratio:.0%}) in {self.seconds:.2f}s, {self.skipped} up to date"
+        )
+
+
+def _compress(data: bytes, fmt: str) -> bytes:
+    if fmt == "gz":
+        # mtime=0 keeps the output byte-identical between builds.
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, quality=11)
+
+
+def _needs_update(source: Path, sibling: Path) -> bool:
+    try:
+        return sibling.stat().st_mtime_ns < source.stat().st_mtime_ns
+    except FileNotFoundError:
+        return True
+
+
+def compress_file(source: Path, formats: tuple[str, ...]) -> tuple[int, int, int, tuple[str, ...]]:
+    """
+    Write the requested siblings of ``source``.
+
+    Returns (siblings written, source bytes, compressed bytes, formats not written because they would not be smaller).
+    """
+    data = source.read_bytes()
+    written = compressed_total = 0
+    incompressible: list[str] = []
+    for fmt in formats:
+        compressed = _compress(data, fmt)
+        sibling = source.with_name(f"{source.name}.{fmt}")
+        if len(compressed) >= len(data):
+            sibling.unlink(missing_ok=True)
+            incompressible.append(fmt)
+            continue
+        # Write then rename: readers never see a partial file, and an existing hardlinked sibling is replaced, not modified.
+        tmp = sibling.with_name(f".{sibling.name}.tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, sibling)
+        written += 1
+        compressed_total += len(compressed)
+    return written, len(data) * written, compressed_total, tuple(incompressible)
+
+
+def _load_record(path: Path | None) -> dict[str, int]:
+    if path is None or not path.exists():
+        return {}
+    try:
+        return {k: int(v) for k, v in json.loads(path.read_text()).items()}
+    except (ValueError, AttributeError, TypeError):
+        # An unreadable record only costs compressing those files again.
+        return {}
+
+
+def precompress(root: Path, formats: tuple[str, ...] = FORMATS, jobs: int | None = None, record: Path | None = None) -> CompressStats:
+    """
+    Precompress every compressible file below ``root`` across ``jobs`` processes (default: one per core).
+
+    Files whose siblings are all newer than the file itself are skipped without being read. ``record`` is a JSON
+    file remembering the siblings that were not written because they would not be smaller (by the source mtime),
+    so those files are not compressed again on every run.
+    """
+    start = time.perf_counter()
+    stats = CompressStats()
+    # "<relative sibling path>" -> mtime_ns of the source that did not compress.
+    incompressible = _load_record(record)
+    kept: dict[str, int] = {}
+    work: list[tuple[Path, tuple[str, ...]]] = []
+    mtimes: dict[Path, int] = {}
+    for path in files_under(root):
+        if path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        st = path.stat()
+        if st.st_size < MIN_SIZE:
+            continue
+        mtime_ns = st.st_mtime_ns
+        stale = []
+        for fmt in formats:
+            key = f"{path.relative_to(root).as_posix()}.{fmt}"
+            if incompressible.get(key) == mtime_ns:
+                kept[key] = mtime_ns
+            elif _needs_update(path, path.with_name(f"{path.name}.{fmt}")):
+                stale.append(fmt)
+        if stale:
+            work.append((path, tuple(stale)))
+            mtimes[path] = mtime_ns
+        else:
+            stats.skipped += 1
+    if work:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(compress_file, *zip(*work, strict=True), chunksize=16)
+            for (path, _), (written, source_bytes, compressed_bytes, skipped_formats) in zip(work, results, strict=True):
+                stats.files += written
+                stats.source_bytes += source_bytes
+                stats.compressed_bytes += compressed_bytes
+                for fmt in skipped_formats:
+                    kept[f"{path.relative_to(root).as_posix()}.{fmt}"] = mtimes[path]
+    if record is not None and kept != incompressible:
+        record.parent.mkdir(parents=True, exist_ok=True)
+        record.write_text(json.dumps(kept, indent=1))
+    stats.seconds = time.perf_counter() - start
+    return stats
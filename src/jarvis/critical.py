@@ -0,0 +1,143 @@
+"""Critical CSS: the stylesheet rules needed to render the part of a page above the fold."""
+
+import re
+from dataclasses import dataclass, field
+
+from jarvis.minify import minify_css
+
+# Placed in a template right after the content visible on first paint; without it the whole page counts.
+FOLD_MARKER = "<!-- fold -->"
+# A stylesheet up to this size is inlined whole: it still fits in the first round trips of a fresh connection.
+INLINE_LIMIT = 14 * 1024
+
+_TAG = re.compile(r"<([a-zA-Z][\w-]*)([^>]*)>")
+_ATTRIBUTE = re.compile(r"""\b(class|id)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+_PSEUDO = re.compile(r"::?[\w-]+(?:\([^)]*\))?")
+_ATTRIBUTE_SELECTOR = re.compile(r"\[[^\]]*\]")
+_COMBINATOR = re.compile(r"[\s>+~]+")
+_SIMPLE_SELECTOR = re.compile(r"([.#]?)(-?[_a-zA-Z][\w-]*)")
+_KEYFRAMES = re.compile(r"@(?:-\w+-)?keyframes\s+([\w-]+)")
+
+
+@dataclass
+class UsedSelectors:
+    tags: set[str] = field(default_factory=lambda: {"html", "body"})
+    classes: set[str] = field(default_factory=set)
+    ids: set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_html(cls, html: str) -> "UsedSelectors":
+        used = cls()
+        for tag, attributes in _TAG.findall(html):
+            used.tags.add(tag.lower())
+            for name, *values in _ATTRIBUTE.findall(attributes):
+                value = "".join(values)
+                if name == "class":
+                    used.classes.update(value.split())
+                else:
+                    used.ids.add(value)
+        return used
+
+    def matches(self, selector: str) -> bool:
+        """
+        Whether every tag, class and id in ``selector`` occurs in the page.
+
+        Pseudo-classes and attribute selectors are ignored, so this over-approximates: a rule may be kept that the
+        browser would not apply, but never the other way round.
+        """
+        compound_selectors = _COMBINATOR.split(_ATTRIBUTE_SELECTOR.sub("", _PSEUDO.sub("", selector)).strip())
+        for compound in compound_selectors:
+            for prefix, name in _SIMPLE_SELECTOR.findall(compound):
+                if prefix == "." and name not in self.classes:
+                    return False
+                if prefix == "#" and name not in self.ids:
+                    return False
+                if not prefix and name.lower() not in self.tags:
+                    return False
+        return True
+
+
+def split_blocks(css: str) -> list[tuple[str, str | None]]:
+    """Top-level ``(prelude, body)`` pairs of a minified stylesheet; statements such as ``@import`` have no body."""
+    blocks: list[tuple[str, str | None]] = []
+    depth = start = body_start = 0
+    quote = ""
+    i = 0
+    while i < len(css):
+        c = css[i]
+        if quote:
+            if c == "\\":
+                i += 1
+            elif c == quote:
+                quote = ""
+        elif c in "\"'":
+            quote = c
+        elif c == "{":
+            if depth == 0:
+                body_start = i
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append((css[start:body_start].strip(), css[body_start + 1 : i]))
+                start = i + 1
+        elif c == ";" and depth == 0:
+            blocks.append((css[start:i].strip(), None))
+            start = i + 1
+        i += 1
+    return blocks
+
+
+def _critical_rules(css: str, used: UsedSelectors) -> list[str]:
+    rules = []
+    for prelude, body in split_blocks(css):
+        if body is None:
+            rules.append(f"{prelude};")
+        elif prelude.startswith(("@media", "@supports")):
+            inner = _critical_rules(body, used)
+            if inner:
+                rules.append(f"{prelude}{{{''.join(inner)}}}")
+        elif prelude.startswith("@font-face"):
+            rules.append(f"{prelude}{{{body}}}")
+        elif prelude.startswith("@"):
+            continue  # keyframes are added once the rules using them are known
+        else:
+            selectors = [s for s in prelude.split(",") if used.matches(s)]
+            if selectors:
+                rules.append(f"{','.join(selectors)}{{{body}}}")
+    return rules
+
+
+def critical_css(css: str, html: str) -> str:
+    """
+    The rules of ``css`` that can apply to the part of ``html`` above :data:`FOLD_MARKER`, minified.
+
+    Only the selectors of a selector list that match are kept. ``@media``/``@supports`` blocks are filtered
+    recursively, ``@font-face`` is always kept, and ``@keyframes`` only when a kept rule refers to them.
+    """
+    above_fold = html.split(FOLD_MARKER, 1)[0]
+    minified = minify_css(css)
+    rules = _critical_rules(minified, UsedSelectors.from_html(above_fold))
+    text = "".join(rules)
+    for prelude, body in split_blocks(minified):
+        m = _KEYFRAMES.match(prelude)
+        if m and body is not None and re.search(rf"\b{re.escape(m.group(1))}\b", text):
+            rules.append(f"{prelude}{{{body}}}")
+    return "".join(rules)
+
+
+@dataclass
+class Stylesheet:
+    """How a page loads its stylesheet: rules to inline in ``<style>``, and whether and how to link the file."""
+
+    href: str
+    inline: str = ""
+    link: str = "blocking"  # "blocking", "deferred" (loaded without blocking the first render) or "none"
+
+
+def plan_stylesheet(href: str, css: str, html: str, inline_limit: int = INLINE_LIMIT) -> Stylesheet:
+    """Inline ``css`` whole when it is at most ``inline_limit`` bytes minified, else its critical rules and defer the file."""
+    minified = minify_css(css)
+    if len(minified.encode()) <= inline_limit:
+        return Stylesheet(href, inline=minified, link="none")
+    return Stylesheet(href, inline=critical_css(css, html), link="deferred")
@@ -0,0 +1,111 @@
+"""Dependency graph from source files and templates to the pages generated from them."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from jinja2 import BaseLoader, Environment, meta
+
+from jarvis.build import PageWriter
+from jarvis.files import files_under
+
+
+class GraphWriter(PageWriter, Protocol):
+    @property
+    def env(self) -> Environment: ...
+
+    @property
+    def template_name(self) -> str: ...
+
+    def sources(self) -> list[Path]: ...
+
+
+def _loader(env: Environment) -> BaseLoader:
+    if env.loader is None:
+        raise ValueError("The template environment has no loader")
+    return env.loader
+
+
+def referenced_templates(env: Environment, name: str) -> list[str]:
+    """Templates ``name`` includes, extends or imports by literal name (dynamic references can't be resolved)."""
+    source, _, _ = _loader(env).get_source(env, name)
+    return sorted(t for t in meta.find_referenced_templates(env.parse(source)) if t is not None)
+
+
+def template_graph(env: Environment, name: str) -> dict[str, list[str]]:
+    """Edges from ``name`` to its referenced templates, followed transitively."""
+    graph: dict[str, list[str]] = {}
+    stack = [name]
+    while stack:
+        current = stack.pop()
+        if current not in graph:
+            graph[current] = referenced_templates(env, current)
+            stack.extend(graph[current])
+    return graph
+
+
+def template_files(env: Environment, name: str) -> list[Path]:
+    """Source files of ``name`` and of every template it depends on."""
+    files = []
+    for template in sorted(template_graph(env, name)):
+        _, filename, _ = _loader(env).get_source(env, template)
+        if filename is not None:
+            files.append(Path(filename))
+    return files
+
+
+def expand_sources(sources: list[Path]) -> list[Path]:
+    """Replace source directories by the files below them."""
+    return [f for s in sources for f in (files_under(s) if s.is_dir() else [s])]
+
+
+@dataclass
+class PageNode:
+    outputs: list[Path]
+    sources: list[Path]  # data files, and directories standing for every file below them
+    templates: dict[str, list[str]]  # template name -> referenced templates
+    template_files: list[Path]
+
+
+class DependencyGraph:
+    def __init__(self, pages: dict[str, PageNode]) -> None:
+        self.pages = pages
+
+    @classmethod
+    def from_writers(cls, writers: dict[str, GraphWriter]) -> "DependencyGraph":
+        return cls(
+            {
+                name: PageNode(
+                    outputs=writer.outputs(),
+                    sources=writer.sources(),
+                    templates=template_graph(writer.env, writer.template_name),
+                    template_files=template_files(writer.env, writer.template_name),
+                )
+                for name, writer in writers.items()
+            }
+        )
+
+    def pages_affected(self, changed: Iterable[Path]) -> set[str]:
+        """Names of the pages that must be regenerated when the ``changed`` files change."""
+        changed = [p.resolve() for p in changed]
+        affected = set()
+        for name, node in self.pages.items():
+            deps = [p.resolve() for p in (*node.sources, *node.template_files)]
+            if any(c == d or d in c.parents for c in changed for d in deps):
+                affected.add(name)
+        return affected
+
+    def format(self) -> str:
+        lines = []
+        for name, node in self.pages.items():
+            copied = f" (+{len(node.outputs) - 1} copied files)" if len(node.outputs) > 1 else ""
+            lines.append(f"{name} -> {node.outputs[0]}{copied}" if node.outputs else name)
+            lines.append("  sources:")
+            for source in node.sources:
+                suffix = f"/ ({len(files_under(source))} files)" if source.is_dir() else ""
+                lines.append(f"    {source}{suffix}")
+            lines.append("  templates:")
+            for template, refs in sorted(node.templates.items()):
+                lines.append(f"    {template}" + (f" -> {', '.join(refs)}" if refs else ""))
+        return "\n".join(lines)
@@ -0,0 +1,19 @@
+"""File helpers shared by the build manifest and the mirror step; kept import-light for CLI startup."""
+
+import hashlib
+from pathlib import Path
+
+
+def files_under(path: Path) -> list[Path]:
+    """Return every file below ``path`` in a stable order (empty if ``path`` does not exist)."""
+    if not path.exists():
+        return []
+    return sorted(p for p in path.rglob("*") if p.is_file())
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
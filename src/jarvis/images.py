@@ -0,0 +1,142 @@
+"""Resized WebP and PNG variants of the landing card images, so the cards can offer a ``srcset``."""
+
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image
+
+from jarvis.assets import ASSETS_URL, HASH_LENGTH
+from jarvis.files import file_digest
+
+WIDTHS = (320, 640, 960)
+# WebP for browsers that support it, PNG as the fallback of the <img> itself.
+FORMATS = ("webp", "png")
+# Directory of the variants below the output root, as used in URLs. Inside the landing's own directory, because
+# Sphinx's HTML builder owns ``_images`` (the blog images), and jarvis deletes whatever it does not own here.
+IMAGES_URL = f"{ASSETS_URL}/images"
+
+
+@dataclass
+class Variant:
+    name: str  # file name below the images directory; unique per source content, width and format
+    width: int
+    height: int
+    format: str
+
+
+@dataclass
+class ResponsiveImage:
+    variants: list[Variant]
+
+    def srcset(self, fmt: str) -> str:
+        return ", ".join(f"{IMAGES_URL}/{v.name} {v.width}w" for v in self.variants if v.format == fmt)
+
+    @property
+    def fallback(self) -> Variant:
+        """The widest PNG, for browsers without ``srcset`` support."""
+        return max((v for v in self.variants if v.format == "png"), key=lambda v: v.width)
+
+    @property
+    def src(self) -> str:
+        return f"{IMAGES_URL}/{self.fallback.name}"
+
+
+def variant_widths(width: int) -> list[int]:
+    """The configured widths narrower than the image, plus the image's own width (capped at the widest); never upscales."""
+    return [w for w in WIDTHS if w < min(width, WIDTHS[-1])] + [min(width, WIDTHS[-1])]
+
+
+def plan_variants(source: Path, digest: str | None = None) -> list[Variant]:
+    """Variants of ``source``, named by its content hash (computed unless given); only the image header is read."""
+    digest = (digest or file_digest(source))[:HASH_LENGTH]
+    with Image.open(source) as im:
+        width, height = im.size
+    return [Variant(f"{source.stem}.{digest}.{w}.{fmt}", w, max(1, round(height * w / width)), fmt) for w in variant_widths(width) for fmt in FORMATS]
+
+
+def render_variants(source: Path, variants: list[Variant], out_dir: Path) -> int:
+    """Resize ``source`` into each of ``variants`` below ``out_dir``; returns the bytes written."""
+    written = 0
+    with Image.open(source) as im:
+        im.load()
+        for v in variants:
+            resized = im if (v.width, v.height) == im.size else im.resize((v.width, v.height), Image.Resampling.LANCZOS)
+            target = out_dir / v.name
+            # Write then rename: an interrupted build never leaves a truncated variant that looks cached.
+            tmp = target.with_name(f".{target.name}.tmp")
+            if v.format == "webp":
+                resized.save(tmp, "WEBP", quality=80, method=6)
+            else:
+                resized.save(tmp, "PNG", optimize=True)
+            os.replace(tmp, target)
+            written += target.stat().st_size
+    return written
+
+
+@dataclass
+class ImageStats:
+    images: int = 0
+    rendered: int = 0  # images whose variants were (re)generated
+    bytes: int = 0
+    pruned: int = 0  # variants of images no longer used, deleted
+
+    def summary(self) -> str:
+        return (
+            f"image variants: {self.rendered} of {self.images} images rendered ({self.bytes / 1e3:.0f} KB), "
+            f"{self.images - self.rendered} cached, {self.pruned} stale variants pruned"
+        )
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    # The pipeline can run on a writer thread (build --parallel); forking a threaded process can deadlock the child.
+    return multiprocessing.get_context("forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+
+
+class ImagePipeline:
+    """
+    Generate the variants of the card images into ``out_dir``, across ``jobs`` processes (default: one per core).
+
+    Variant names contain the source's content hash, so an image whose variants all exist is a cache hit and is
+    neither decoded nor resized again. ``out_dir`` holds only these variants: those of images no longer passed
+    to ``run`` are deleted. ``digest`` supplies the content hashes, e.g. from the build manifest's cache; the
+    planned variants are kept per source content, so planning an unchanged image again opens no file.
+    """
+
+    def __init__(self, out_dir: Path, jobs: int | None = None, digest: Callable[[Path], str | None] = file_digest) -> None:
+        self.out_dir = out_dir
+        self.jobs = jobs
+        self.digest = digest
+        self.stats = ImageStats()
+        self._plans: dict[tuple[Path, str | None], list[Variant]] = {}
+
+    def plan(self, sources: list[Path]) -> dict[Path, ResponsiveImage]:
+        images = {}
+        for source in sources:
+            key = (source, self.digest(source))
+            if key not in self._plans:
+                self._plans[key] = plan_variants(source, key[1])
+            images[source] = ResponsiveImage(self._plans[key])
+        return images
+
+    def run(self, sources: list[Path]) -> dict[Path, ResponsiveImage]:
+        images = self.plan(sources)
+        work = [(source, image.variants) for source, image in images.items() if not all((self.out_dir / v.name).exists() for v in image.variants)]
+        self.stats = ImageStats(images=len(images), rendered=len(work))
+        if work:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            with ProcessPoolExecutor(max_workers=min(self.jobs or os.cpu_count() or 1, len(work)), mp_context=_pool_context()) as pool:
+                self.stats.bytes = sum(pool.map(render_variants, *zip(*work, strict=True), [self.out_dir] * len(work)))
+        self.stats.pruned = self._prune({v.name for image in images.values() for v in image.variants})
+        return images
+
+    def _prune(self, wanted: set[str]) -> int:
+        if not self.out_dir.is_dir():
+            return 0
+        stale = [path for path in self.out_dir.iterdir() if path.is_file() and path.name not in wanted]
+        for path in stale:
+            path.unlink()
+        return len(stale)
@@ -1,14 +1,23 @@
 """Generate the standalone HTML landing page that overrides Sphinx's index."""
 
-import shutil
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment
+from py_app_dev.core.logging import logger
 
+from jarvis.assets import ASSETS_URL, MANIFEST_NAME, AssetManifest
+from jarvis.critical import Stylesheet, plan_stylesheet
+from jarvis.deps import expand_sources, template_files
+from jarvis.files import file_digest, files_under
+from jarvis.images import IMAGES_URL, ImagePipeline, ImageStats, ResponsiveImage
+from jarvis.minify import PageSize, write_atomic, write_minified
+from jarvis.mirror import DEFAULT_JOBS, MirrorMode, MirrorPlan, MirrorStats
 from jarvis.presentations import Presentations
 from jarvis.teaching import Teaching
-from jarvis.writing import scan_blogs
+from jarvis.templating import get_environment
+from jarvis.writing import FrontmatterIndex, scan_blogs
 
 
 @dataclass
@@ -110,6 +119,13 @@ class LandingWriter:
         blogs_dir: Path,
         output_dir: Path,
         templates_dir: Path | None = None,
+        mirror_mode: MirrorMode = MirrorMode.COPY,
+        mirror_checksum: bool = False,
+        jobs: int = DEFAULT_JOBS,
+        cache_dir: Path | None = None,
+        minify: bool = False,
+        critical_css: bool = False,
+        digest: Callable[[Path], str | None] = file_digest,
     ) -> None:
         self.presentations_file = presentations_file
         self.presentations_dir = presentations_dir
@@ -118,47 +134,161 @@ class LandingWriter:
         self.blogs_dir = blogs_dir
         self.output_dir = output_dir
         self.templates_dir = templates_dir or Path(__file__).parent / "templates" / "landing"
+        self.mirror_mode = mirror_mode
+        self.mirror_checksum = mirror_checksum
+        self.jobs = jobs
+        self.cache_dir = cache_dir
+        self.minify = minify
+        # Inline the stylesheet (whole if small, else the rules used above the fold) and load the file deferred.
+        self.critical_css = critical_css
+        self.mirror_stats = MirrorStats()
+        self.image_stats = ImageStats()
+        # Shared by write() and outputs(); ``digest`` lets the build manifest's cache spare re-hashing the card images.
+        self.image_pipeline = ImagePipeline(self.images_dir, digest=digest)
+        self.page_sizes: list[PageSize] = []
+
+    @property
+    def env(self) -> Environment:
+        return get_environment(self.templates_dir.parent, self.cache_dir)
+
+    @property
+    def template_name(self) -> str:
+        return f"{self.templates_dir.name}/index.html.j2"
+
+    def sources(self) -> list[Path]:
+        """Data files and directories the landing page and its copied directories are generated from."""
+        return [
+            self.presentations_file,
+            self.teaching_file,
+            self.blogs_dir,
+            self.assets_dir,
+            self.presentations_dir,
+            self.notebooks_dir,
+        ]
+
+    def inputs(self) -> list[Path]:
+        return [*expand_sources(self.sources()), *template_files(self.env, self.template_name)]
+
+    def outputs(self) -> list[Path]:
+        outputs = [self.output_dir / "index.html"]
+        assets = self.asset_manifest().assets
+        if assets:
+            outputs.extend(self.output_dir / ASSETS_URL / a.name for a in assets.values())
+            outputs.append(self.output_dir / ASSETS_URL / MANIFEST_NAME)
+        card_images = self.card_images(Presentations.from_json_file(self.presentations_file), Teaching.from_json_file(self.teaching_file))
+        for image in self.image_pipeline.plan(sorted({p for p in card_images.values() if p.is_file()})).values():
+            outputs.extend(self.output_dir / IMAGES_URL / v.name for v in image.variants)
+        for src_dir in (self.presentations_dir, self.notebooks_dir):
+            outputs.extend(self.output_dir / p.relative_to(src_dir) for p in files_under(src_dir))
+        return outputs
+
+    @property
+    def assets_dir(self) -> Path:
+        return self.templates_dir / "assets"
+
+    def asset_manifest(self) -> AssetManifest:
+        """The assets as this writer publishes them; the about page links the same fingerprinted names."""
+        return AssetManifest.from_dir(self.assets_dir, self.minify)
+
+    def asset_sources(self) -> list[Path]:
+        return [self.assets_dir]
+
+    @property
+    def images_dir(self) -> Path:
+        """Where the card image variants are generated; with a cache directory they survive a clean output."""
+        return self.cache_dir / "images" if self.cache_dir else self.output_dir / IMAGES_URL
+
+    def card_images(self, presentations: Presentations, teaching: Teaching) -> dict[str, Path]:
+        """Card images as referenced in the JSON files (relative to the docs directory), mapped to their files."""
+        refs = [(p.image, self.presentations_file.parent) for p in (*presentations.talks, *presentations.demos)]
+        refs.extend((n.image, self.teaching_file.parent) for n in teaching.notebooks)
+        return {image: base / image for image, base in refs if image}
 
     def write(self) -> None:
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         presentations = Presentations.from_json_file(self.presentations_file)
         teaching = Teaching.from_json_file(self.teaching_file)
-        writing = scan_blogs(self.blogs_dir)
-        env = Environment(
-            loader=FileSystemLoader([str(self.templates_dir), str(self.templates_dir.parent)]),
-            autoescape=select_autoescape(["html"]),
-        )
-
-        tmpl = env.get_template("index.html.j2")
-        html = tmpl.render(
-            projects=PROJECTS,
-            talks=presentations.talks,
-            demos=presentations.demos,
-            notebooks=teaching.notebooks,
-            writing=writing,
-        )
-        (self.output_dir / "index.html").write_text(html)
-
-        assets_src = self.templates_dir / "assets"
-        if assets_src.exists():
-            assets_dst = self.output_dir / "_landing"
-            if assets_dst.exists():
-                shutil.rmtree(assets_dst)
-            shutil.copytree(assets_src, assets_dst)
-
-        self._copy_subdirs(self.presentations_dir)
-        self._copy_subdirs(self.notebooks_dir)
-
-    def _copy_subdirs(self, src_dir: Path) -> None:
-        """Copy each subdirectory of src_dir into output_dir (mirrors Sphinx html_extra_path behavior)."""
+        card_images = self.card_images(presentations, teaching)
+        for image, path in card_images.items():
+            if not path.is_file():
+                logger.warning(f"Card image {image} not found, the card is rendered without it")
+        card_images = {image: path for image, path in card_images.items() if path.is_file()}
+        variants = self.image_pipeline.run(sorted(set(card_images.values())))
+        self.image_stats = self.image_pipeline.stats
+        logger.info(self.image_stats.summary())
+        images: dict[str, ResponsiveImage] = {image: variants[path] for image, path in card_images.items()}
+        index = FrontmatterIndex(self.cache_dir / "frontmatter.json") if self.cache_dir else None
+        writing = scan_blogs(self.blogs_dir, index=index)
+        assets = self.asset_manifest()
+        tmpl = self.env.get_template(self.template_name)
+
+        def render(stylesheet: Stylesheet) -> str:
+            return tmpl.render(
+                asset_url=assets.url,
+                stylesheet=stylesheet,
+                projects=PROJECTS,
+                talks=presentations.talks,
+                demos=presentations.demos,
+                notebooks=teaching.notebooks,
+                writing=writing,
+                images=images,
+            )
+
+        stylesheet = Stylesheet(assets.url("landing.css"))
+        html = render(stylesheet)
+        if self.critical_css:
+            # The critical rules depend on the rendered page, so it is rendered a second time with them inlined.
+            stylesheet = plan_stylesheet(stylesheet.href, assets.assets["landing.css"].source.read_text(), html)
+            html = render(stylesheet)
+        self.page_sizes = []
+        if self.minify:
+            self.page_sizes.append(write_minified(self.output_dir / "index.html", html))
+        else:
+            (self.output_dir / "index.html").write_text(html)
+
+        plan = MirrorPlan()
+        assets_dst = self.output_dir / ASSETS_URL
+        # Assets are copied under their fingerprinted names; minified ones are written below instead.
+        minified = [(a, a.content) for a in assets.assets.values() if a.content is not None]
+        transfers = [(a.source, assets_dst / a.name) for a in assets.assets.values() if a.content is None]
+        keep = [assets_dst / a.name for a, _ in minified]
+        if assets.assets:
+            keep.append(assets_dst / MANIFEST_NAME)
+        # The image variants live below the assets directory, so one plan covers (and prunes) both.
+        images_dst = self.output_dir / IMAGES_URL
+        variant_names = [v.name for image in images.values() for v in image.variants]
+        if self.images_dir == images_dst:
+            keep.extend(images_dst / name for name in variant_names)
+        else:
+            transfers.extend((self.images_dir / name, images_dst / name) for name in variant_names)
+        if transfers or keep:
+            plan.add_files(assets_dst, transfers, keep=keep)
+        self._copy_subdirs(self.presentations_dir, plan)
+        self._copy_subdirs(self.notebooks_dir, plan)
+        self.mirror_stats = plan.execute(self.mirror_mode, self.mirror_checksum, self.jobs)
+        logger.info(self.mirror_stats.summary())
+        for asset, content in minified:
+            dst = assets_dst / asset.name
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(dst, content)
+            self.page_sizes.append(PageSize.measure(dst, asset.source.read_bytes(), content))
+        if assets.assets:
+            (assets_dst / MANIFEST_NAME).write_text(assets.to_json())
+        for size in self.page_sizes:
+            logger.info(size.summary())
+
+    def _copy_subdirs(self, src_dir: Path, plan: MirrorPlan) -> None:
+        """
+        Plan mirroring each entry of src_dir into output_dir (mirrors Sphinx html_extra_path behavior).
+
+        Only files that differ by size + mtime (or content, with ``mirror_checksum``) are transferred.
+        """
         if not src_dir.exists():
             return
         for item in src_dir.iterdir():
             dst = self.output_dir / item.name
             if item.is_dir():
-                if dst.exists():
-                    shutil.rmtree(dst)
-                shutil.copytree(item, dst)
+                plan.add_tree(item, dst)
             else:
-                shutil.copy2(item, dst)
+                plan.add_file(item, dst)
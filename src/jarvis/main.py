@@ -1,28 +1,55 @@
 import sys
+from collections.abc import Callable
+from functools import wraps
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any, TypeVar
 
 import typer
 from py_app_dev.core.exceptions import UserNotificationException
-from py_app_dev.core.logging import logger, setup_logger, time_it
 
 from jarvis import __version__
-from jarvis.about import AboutWriter
-from jarvis.blog import BlogWritter
-from jarvis.landing import LandingWriter
+from jarvis.mirror import DEFAULT_JOBS, MirrorMode
+
+# Writers (jinja2, markdown, mashumaro) and the logger (loguru) are imported inside the commands,
+# so `jarvis --version` and `jarvis blog` don't pay for them. Check with `jarvis --startup-profile`.
 
 package_name = "jarvis"
 
 app = typer.Typer(name=package_name, help="a", no_args_is_help=True, add_completion=False)
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def time_it(message: str) -> Callable[[_F], _F]:
+    """py_app_dev's ``time_it``, with the logger imported and set up only once a command actually runs."""
+
+    def decorator(func: _F) -> _F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            from py_app_dev.core.logging import setup_logger
+            from py_app_dev.core.logging import time_it as _time_it
+
+            setup_logger()
+            return _time_it(message)(func)(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
 
 @app.callback(invoke_without_command=True)
 def version(
     version: bool = typer.Option(None, "--version", "-v", is_eager=True, help="Show version and exit."),
+    startup_profile: bool = typer.Option(False, "--startup-profile", is_eager=True, help="Report the slowest imports of the CLI and exit."),
 ) -> None:
     if version:
         typer.echo(f"{package_name} {__version__}")
         raise typer.Exit()
+    if startup_profile:
+        from jarvis.startup import startup_report
+
+        typer.echo(startup_report())
+        raise typer.Exit()
 
 
 @app.command()
@@ -33,6 +60,8 @@ def blog(
     category: str = "uncategorized",
     tags: Annotated[list[str] | None, typer.Option()] = None,
 ) -> None:
+    from jarvis.blog import BlogWritter
+
     BlogWritter(output_dir, title, category, tags).write()
 
 
@@ -45,8 +74,29 @@ def landing(
     notebooks_dir: Path = typer.Option(help="Directory of notebook HTML subdirs to copy into the output."),  # noqa: B008
     blogs_dir: Path = typer.Option(help="Directory of blog post markdown files (scanned for the writing section)."),  # noqa: B008
     output_dir: Path = typer.Option(help="Output directory (typically the Sphinx build root)."),  # noqa: B008
+    mirror_mode: MirrorMode = typer.Option(MirrorMode.COPY, help="How unchanged presentation/notebook files are placed in the output."),  # noqa: B008
+    mirror_checksum: bool = typer.Option(False, help="Compare files by content instead of size + mtime when mirroring."),
+    jobs: int = typer.Option(DEFAULT_JOBS, help="Number of threads mirroring files into the output."),
+    cache_dir: Path = typer.Option(Path("build/.jarvis-cache"), help="Directory holding the compiled-template cache."),  # noqa: B008
+    minify: bool = typer.Option(False, "--minify", help="Minify the generated HTML and the landing CSS, and report their sizes."),
+    critical_css: bool = typer.Option(False, "--critical-css", help="Inline the landing CSS used above the fold and load the stylesheet deferred."),
 ) -> None:
-    LandingWriter(presentations_file, presentations_dir, teaching_file, notebooks_dir, blogs_dir, output_dir).write()
+    from jarvis.landing import LandingWriter
+
+    LandingWriter(
+        presentations_file,
+        presentations_dir,
+        teaching_file,
+        notebooks_dir,
+        blogs_dir,
+        output_dir,
+        mirror_mode=mirror_mode,
+        mirror_checksum=mirror_checksum,
+        jobs=jobs,
+        cache_dir=cache_dir,
+        minify=minify,
+        critical_css=critical_css,
+    ).write()
 
 
 @app.command()
@@ -55,16 +105,154 @@ def about(
     about_md_file: Path = typer.Option(help="Source markdown file (docs/about.md)."),  # noqa: B008
     timeline_file: Path = typer.Option(help="Input timeline JSON file."),  # noqa: B008
     output_dir: Path = typer.Option(help="Output directory (typically the Sphinx build root)."),  # noqa: B008
+    cache_dir: Path = typer.Option(Path("build/.jarvis-cache"), help="Directory holding the compiled-template cache."),  # noqa: B008
+    minify: bool = typer.Option(False, "--minify", help="Minify the generated HTML and report its size; the CSS is linked as the landing page published it."),
+) -> None:
+    from jarvis.about import AboutWriter
+
+    AboutWriter(about_md_file, timeline_file, output_dir, cache_dir=cache_dir, minify=minify).write()
+
+
+@app.command()
+@time_it("build")
+def build(
+    presentations_file: Path = typer.Option(help="Input presentations JSON file."),  # noqa: B008
+    presentations_dir: Path = typer.Option(help="Directory of presentation HTML subdirs to copy into the output."),  # noqa: B008
+    teaching_file: Path = typer.Option(help="Input teaching JSON file."),  # noqa: B008
+    notebooks_dir: Path = typer.Option(help="Directory of notebook HTML subdirs to copy into the output."),  # noqa: B008
+    blogs_dir: Path = typer.Option(help="Directory of blog post markdown files (scanned for the writing section)."),  # noqa: B008
+    about_md_file: Path = typer.Option(help="Source markdown file (docs/about.md)."),  # noqa: B008
+    timeline_file: Path = typer.Option(help="Input timeline JSON file."),  # noqa: B008
+    output_dir: Path = typer.Option(help="Output directory (typically the Sphinx build root)."),  # noqa: B008
+    cache_dir: Path = typer.Option(Path("build/.jarvis-cache"), help="Directory holding the build manifest and compiled-template cache."),  # noqa: B008
+    force: bool = typer.Option(False, "--force", help="Regenerate every page, ignoring the manifest."),
+    mirror_mode: MirrorMode = typer.Option(MirrorMode.COPY, help="How unchanged presentation/notebook files are placed in the output."),  # noqa: B008
+    mirror_checksum: bool = typer.Option(False, help="Compare files by content instead of size + mtime when mirroring."),
+    jobs: int = typer.Option(DEFAULT_JOBS, help="Number of threads mirroring files into the output."),
+    parallel: bool = typer.Option(False, "--parallel", help="Run the page writers concurrently."),
+    compress: bool = typer.Option(False, "--compress", help="Afterwards write .gz/.br siblings of every compressible file in the output."),
+    minify: bool = typer.Option(False, "--minify", help="Minify the generated HTML and the landing CSS, and report their sizes."),
+    critical_css: bool = typer.Option(False, "--critical-css", help="Inline the landing CSS used above the fold and load the stylesheet deferred."),
+) -> None:
+    """Generate every page in one process, skipping those whose inputs and outputs are unchanged."""
+    from jarvis.about import AboutWriter
+    from jarvis.build import BuildManifest, IncrementalBuilder
+    from jarvis.landing import LandingWriter
+
+    manifest = BuildManifest(cache_dir / "manifest.json")
+    builder = IncrementalBuilder(manifest, force=force, settings=f"minify={minify} critical_css={critical_css}")
+    landing_writer = LandingWriter(
+        presentations_file,
+        presentations_dir,
+        teaching_file,
+        notebooks_dir,
+        blogs_dir,
+        output_dir,
+        mirror_mode=mirror_mode,
+        mirror_checksum=mirror_checksum,
+        jobs=jobs,
+        cache_dir=cache_dir,
+        minify=minify,
+        critical_css=critical_css,
+        digest=manifest.digest,
+    )
+    about_writer = AboutWriter(about_md_file, timeline_file, output_dir, cache_dir=cache_dir, minify=minify, assets=landing_writer)
+    builder.run_all({"landing": landing_writer, "about": about_writer}, parallel=parallel)
+    manifest.save()
+    if compress:
+        from py_app_dev.core.logging import logger
+        from py_app_dev.core.logging import time_it as _time_it
+
+        from jarvis.compress import precompress
+
+        logger.info(_time_it("compress")(precompress)(output_dir, record=cache_dir / "compress.json").summary())
+
+
+@app.command()
+@time_it("compress")
+def compress(
+    output_dir: Path = typer.Option(help="Directory whose compressible files get .gz/.br siblings (typically the Sphinx build root)."),  # noqa: B008
+    jobs: int | None = typer.Option(None, help="Number of compression processes (default: one per core)."),
+    cache_dir: Path = typer.Option(Path("build/.jarvis-cache"), help="Directory holding the record of files not worth compressing."),  # noqa: B008
+) -> None:
+    """Write precompressed .gz and .br siblings for the site's text assets."""
+    from py_app_dev.core.logging import logger
+
+    from jarvis.compress import precompress
+
+    logger.info(precompress(output_dir, jobs=jobs, record=cache_dir / "compress.json").summary())
+
+
+@app.command()
+def watch(
+    presentations_file: Path = typer.Option(help="Input presentations JSON file."),  # noqa: B008
+    presentations_dir: Path = typer.Option(help="Directory of presentation HTML subdirs to copy into the output."),  # noqa: B008
+    teaching_file: Path = typer.Option(help="Input teaching JSON file."),  # noqa: B008
+    notebooks_dir: Path = typer.Option(help="Directory of notebook HTML subdirs to copy into the output."),  # noqa: B008
+    blogs_dir: Path = typer.Option(help="Directory of blog post markdown files (scanned for the writing section)."),  # noqa: B008
+    about_md_file: Path = typer.Option(help="Source markdown file (docs/about.md)."),  # noqa: B008
+    timeline_file: Path = typer.Option(help="Input timeline JSON file."),  # noqa: B008
+    output_dir: Path = typer.Option(help="Output directory (typically the Sphinx build root)."),  # noqa: B008
+    cache_dir: Path = typer.Option(Path("build/.jarvis-cache"), help="Directory holding the compiled-template cache."),  # noqa: B008
+    poll_interval: float = typer.Option(0.1, help="Seconds between checks of the input files."),
+    debounce: float = typer.Option(0.2, help="Seconds the inputs must stay unchanged before a page is regenerated."),
 ) -> None:
-    AboutWriter(about_md_file, timeline_file, output_dir).write()
+    """Generate every page, then regenerate only the affected page whenever its inputs change."""
+    from py_app_dev.core.logging import setup_logger
+
+    from jarvis.about import AboutWriter
+    from jarvis.build import PageWriter
+    from jarvis.landing import LandingWriter
+    from jarvis.watch import Watcher
+
+    setup_logger()
+    landing_writer = LandingWriter(presentations_file, presentations_dir, teaching_file, notebooks_dir, blogs_dir, output_dir, cache_dir=cache_dir)
+    writers: dict[str, PageWriter] = {
+        "landing": landing_writer,
+        "about": AboutWriter(about_md_file, timeline_file, output_dir, cache_dir=cache_dir, assets=landing_writer),
+    }
+    for writer in writers.values():
+        writer.write()
+    Watcher(writers, poll_interval=poll_interval, debounce=debounce).run()
+
+
+@app.command()
+def deps(
+    presentations_file: Path = typer.Option(help="Input presentations JSON file."),  # noqa: B008
+    presentations_dir: Path = typer.Option(help="Directory of presentation HTML subdirs to copy into the output."),  # noqa: B008
+    teaching_file: Path = typer.Option(help="Input teaching JSON file."),  # noqa: B008
+    notebooks_dir: Path = typer.Option(help="Directory of notebook HTML subdirs to copy into the output."),  # noqa: B008
+    blogs_dir: Path = typer.Option(help="Directory of blog post markdown files (scanned for the writing section)."),  # noqa: B008
+    about_md_file: Path = typer.Option(help="Source markdown file (docs/about.md)."),  # noqa: B008
+    timeline_file: Path = typer.Option(help="Input timeline JSON file."),  # noqa: B008
+    output_dir: Path = typer.Option(help="Output directory (typically the Sphinx build root)."),  # noqa: B008
+    changed: Annotated[list[Path] | None, typer.Option(help="Only print the pages affected by these changed files.")] = None,
+) -> None:
+    """Print which sources and templates each generated page depends on."""
+    from jarvis.about import AboutWriter
+    from jarvis.deps import DependencyGraph, GraphWriter
+    from jarvis.landing import LandingWriter
+
+    landing_writer = LandingWriter(presentations_file, presentations_dir, teaching_file, notebooks_dir, blogs_dir, output_dir)
+    writers: dict[str, GraphWriter] = {
+        "landing": landing_writer,
+        "about": AboutWriter(about_md_file, timeline_file, output_dir, assets=landing_writer),
+    }
+    graph = DependencyGraph.from_writers(writers)
+    if changed:
+        for name in sorted(graph.pages_affected(changed)):
+            typer.echo(name)
+    else:
+        typer.echo(graph.format())
 
 
 def main() -> int:
     try:
-        setup_logger()
         app()
         return 0
     except UserNotificationException as e:
+        from py_app_dev.core.logging import logger
+
         logger.error(f"{e}")
         return 1
 
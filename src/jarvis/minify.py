@@ -0,0 +1,112 @@
+"""Whitespace and comment minification of the generated HTML pages and their CSS."""
+
+import gzip
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+# Elements whose content is whitespace-sensitive (or not HTML), copied verbatim; <style> content is minified as CSS.
+_HTML_TOKEN = re.compile(r"<!--.*?-->|<(pre|textarea|script|style)\b[^>]*>.*?</\1\s*>", re.DOTALL | re.IGNORECASE)
+_CSS_TOKEN = re.compile(r"\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'|/\*.*?\*/", re.DOTALL)
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _collapse(text: str) -> str:
+    """Collapse each whitespace run to one character, keeping a newline if the run had one."""
+    return _WHITESPACE.sub(lambda m: "\n" if "\n" in m.group() else " ", text)
+
+
+def _minify_css_code(code: str) -> str:
+    code = _CSS_PUNCTUATION.sub(r"\1", _WHITESPACE.sub(" ", code))
+    # Not before ':', where the space is a descendant combinator (``a :hover``).
+    return code.replace(": ", ":").replace(";}", "}")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments (except ``/*! ... */`` notices) and the whitespace around punctuation; strings are kept as-is."""
+    out: list[str] = []
+    code: list[str] = []
+    pos = 0
+    for m in _CSS_TOKEN.finditer(css):
+        code.append(css[pos : m.start()])
+        token = m.group()
+        if token.startswith("/*"):
+            if token.startswith("/*!"):
+                out.extend((_minify_css_code("".join(code)), token))
+                code.clear()
+        else:
+            out.extend((_minify_css_code("".join(code)), token))
+            code.clear()
+        pos = m.end()
+    code.append(css[pos:])
+    out.append(_minify_css_code("".join(code)))
+    return "".join(out).strip()
+
+
+def minify_html(html: str) -> str:
+    """
+    Strip comments and collapse whitespace runs outside ``<pre>``, ``<textarea>``, ``<script>`` and ``<style>``.
+
+    Whitespace between tags is collapsed, never removed, so inline elements render exactly as before.
+    Conditional comments (``<!--[if ...]>``) are kept, and ``<style>`` blocks are minified with :func:`minify_css`.
+    """
+    out: list[str] = []
+    text: list[str] = []
+    pos = 0
+    for m in _HTML_TOKEN.finditer(html):
+        text.append(html[pos : m.start()])
+        token = m.group()
+        if token.startswith("<!--"):
+            if token.startswith("<!--["):
+                out.extend((_collapse("".join(text)), token))
+                text.clear()
+        else:
+            if (m.group(1) or "").lower() == "style":
+                open_end = token.index(">") + 1
+                close_start = token.rindex("</")
+                token = token[:open_end] + minify_css(token[open_end:close_start]) + token[close_start:]
+            out.extend((_collapse("".join(text)), token))
+            text.clear()
+        pos = m.end()
+    text.append(html[pos:])
+    out.append(_collapse("".join(text)))
+    return "".join(out).strip() + "\n"
+
+
+@dataclass
+class PageSize:
+    path: Path
+    original: int  # bytes as rendered
+    minified: int
+    gzipped: int  # minified, at gzip's default level: roughly what goes over the wire
+
+    @classmethod
+    def measure(cls, path: Path, original: bytes, minified: bytes) -> "PageSize":
+        return cls(path, len(original), len(minified), len(gzip.compress(minified, mtime=0)))
+
+    def summary(self) -> str:
+        saved = 1 - self.minified / self.original if self.original else 0.0
+        return f"{self.path.name}: {self.original:,} -> {self.minified:,} bytes (-{saved:.0%}), {self.gzipped:,} gzipped"
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write ``data`` to a temporary sibling and rename it into place.
+
+    A hardlinked output is thereby replaced, never modified in place (which would also change the source it is linked to).
+    """
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+_MINIFIERS = {".html": minify_html, ".css": minify_css}
+
+
+def write_minified(path: Path, text: str) -> PageSize:
+    """Write ``text`` to ``path`` minified according to its suffix; returns the sizes for the report."""
+    minified = _MINIFIERS[path.suffix](text).encode()
+    write_atomic(path, minified)
+    return PageSize.measure(path, text.encode(), minified)
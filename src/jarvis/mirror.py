@@ -0,0 +1,201 @@
+"""Mirror directory trees into the build output, transferring only the files that differ."""
+
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+
+# The CLI imports this module for MirrorMode at startup, so the heavier imports are deferred to their use.
+
+# Linux FICLONE ioctl: share the source extents copy-on-write (btrfs, xfs, bcachefs, overlayfs on those).
+_FICLONE = 0x40049409
+
+# Precompressed siblings (``<name>.gz``, ``<name>.br``) that jarvis.compress writes next to the output files.
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+# Same default as ThreadPoolExecutor: mirroring is I/O bound, so oversubscribe the cores.
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) + 4)
+
+
+class MirrorMode(str, Enum):
+    COPY = "copy"
+    HARDLINK = "hardlink"
+    REFLINK = "reflink"
+
+
+@dataclass
+class MirrorStats:
+    copied: int = 0
+    linked: int = 0
+    skipped: int = 0
+    deleted: int = 0
+    bytes: int = 0  # bytes of the files copied or linked
+    seconds: float = 0.0
+
+    def __add__(self, other: "MirrorStats") -> "MirrorStats":
+        """Combine the counters of two mirror runs."""
+        return MirrorStats(
+            self.copied + other.copied,
+            self.linked + other.linked,
+            self.skipped + other.skipped,
+            self.deleted + other.deleted,
+            self.bytes + other.bytes,
+            self.seconds + other.seconds,
+        )
+
+    @property
+    def transferred(self) -> int:
+        return self.copied + self.linked
+
+    def summary(self) -> str:
+        seconds = max(self.seconds, 1e-9)
+        mb = self.bytes / 1e6
+        return (
+            f"mirrored {self.transferred} files ({mb:.1f} MB) in {self.seconds:.2f}s: "
+            f"{self.transferred / seconds:.0f} files/s, {mb / seconds:.1f} MB/s "
+            f"({self.linked} linked, {self.skipped} unchanged, {self.deleted} deleted)"
+        )
+
+
+def _is_same(src: Path, dst: Path, checksum: bool) -> bool:
+    try:
+        s, d = src.stat(), dst.stat()
+    except FileNotFoundError:
+        return False
+    if s.st_ino == d.st_ino and s.st_dev == d.st_dev:
+        return True
+    if s.st_size != d.st_size:
+        return False
+    if checksum:
+        from jarvis.files import file_digest
+
+        return file_digest(src) == file_digest(dst)
+    return s.st_mtime_ns == d.st_mtime_ns
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - Windows
+        return False
+    try:
+        with src.open("rb") as fs, dst.open("wb") as fd:
+            fcntl.ioctl(fd.fileno(), _FICLONE, fs.fileno())
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def mirror_file(src: Path, dst: Path, mode: MirrorMode = MirrorMode.COPY, checksum: bool = False) -> MirrorStats:
+    """
+    Make ``dst`` identical to ``src`` unless it already is.
+
+    Files count as identical by size + mtime (or by content with ``checksum``). Links that cannot be
+    created (e.g. across devices, or no reflink support) fall back to a plain copy.
+    """
+    if _is_same(src, dst, checksum):
+        return MirrorStats(skipped=1)
+    if dst.exists() or dst.is_symlink():
+        _remove(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    size = src.stat().st_size
+    if mode is MirrorMode.HARDLINK:
+        try:
+            os.link(src, dst)
+            return MirrorStats(linked=1, bytes=size)
+        except OSError:
+            pass
+    elif mode is MirrorMode.REFLINK and _reflink(src, dst):
+        return MirrorStats(linked=1, bytes=size)
+    shutil.copy2(src, dst)
+    return MirrorStats(copied=1, bytes=size)
+
+
+@dataclass
+class MirrorPlan:
+    """Files to transfer and stale paths to delete, collected up front so the transfers can run concurrently."""
+
+    transfers: list[tuple[Path, Path]] = field(default_factory=list)
+    deletions: list[Path] = field(default_factory=list)
+    # Precompressed siblings kept next to a target; they go stale, and are removed, when the target is transferred.
+    siblings: dict[Path, list[Path]] = field(default_factory=dict)
+
+    def add_file(self, src: Path, dst: Path) -> None:
+        self.transfers.append((src, dst))
+
+    def add_tree(self, src: Path, dst: Path) -> None:
+        """Plan making the tree at ``dst`` identical to ``src``, including deleting extraneous entries."""
+        self.add_files(dst, [(src_file, dst / src_file.relative_to(src)) for src_file in sorted(p for p in src.rglob("*") if p.is_file())])
+
+    def add_files(self, dst: Path, transfers: list[tuple[Path, Path]], keep: list[Path] | None = None) -> None:
+        """
+        Plan the ``transfers`` into the tree at ``dst`` and deleting every other entry below it.
+
+        ``keep`` are further files below ``dst`` that the caller writes itself. Precompressed siblings of the
+        wanted files are kept as well, so a mirror after ``jarvis compress`` does not discard its work.
+        """
+        if dst.exists() and not dst.is_dir():
+            self.deletions.append(dst)
+        wanted: set[Path] = set()
+        for target in [t for _, t in transfers] + (keep or []):
+            rel = target.relative_to(dst)
+            wanted.update(rel.parents)
+            wanted.add(rel)
+        self.transfers.extend(transfers)
+        if dst.is_dir():
+            # Deepest first, so directories are emptied before they are considered.
+            for path in sorted(dst.rglob("*"), key=lambda p: len(p.parts), reverse=True):
+                rel = path.relative_to(dst)
+                if rel in wanted:
+                    continue
+                if path.suffix in COMPRESSED_SUFFIXES and rel.with_suffix("") in wanted:
+                    self.siblings.setdefault(dst / rel.with_suffix(""), []).append(path)
+                else:
+                    self.deletions.append(path)
+
+    def execute(self, mode: MirrorMode = MirrorMode.COPY, checksum: bool = False, jobs: int = DEFAULT_JOBS) -> MirrorStats:
+        """Delete the stale paths, then transfer the files across ``jobs`` threads."""
+        start = time.perf_counter()
+        stats = MirrorStats()
+        for path in self.deletions:
+            if path.exists() or path.is_symlink():
+                _remove(path)
+                stats.deleted += 1
+        if jobs <= 1:
+            for src, dst in self.transfers:
+                stats += self._transfer(src, dst, mode, checksum)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                for result in pool.map(lambda t: self._transfer(t[0], t[1], mode, checksum), self.transfers):
+                    stats += result
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def _transfer(self, src: Path, dst: Path, mode: MirrorMode, checksum: bool) -> MirrorStats:
+        stats = mirror_file(src, dst, mode, checksum)
+        if stats.transferred:
+            for sibling in self.siblings.get(dst, []):
+                sibling.unlink(missing_ok=True)
+        return stats
+
+
+def mirror_tree(src: Path, dst: Path, mode: MirrorMode = MirrorMode.COPY, checksum: bool = False, jobs: int = DEFAULT_JOBS) -> MirrorStats:
+    """Make the tree at ``dst`` identical to ``src``: transfer changed files and delete extraneous ones."""
+    plan = MirrorPlan()
+    plan.add_tree(src, dst)
+    stats = plan.execute(mode, checksum, jobs)
+    dst.mkdir(parents=True, exist_ok=True)
+    return stats
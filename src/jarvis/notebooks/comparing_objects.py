@@ -216,50 +216,76 @@ def __(mo):
 
 @app.cell
 def __():
-    def visualize_rooms():
-        import matplotlib.patches as patches
-        import matplotlib.pyplot as plt
-
-        # Create a figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
-        fig.suptitle("Visualizing Rooms", fontsize=16)
-
-        # --- Room 1: 4x6 ---
-        width1, length1 = 4, 6
-        ax1.set_title("My Room")
-        # Set plot limits
-        ax1.set_xlim(-0.5, 6.5)
-        ax1.set_ylim(-0.5, 6.5)
-        # Draw the rectangle
-        ax1.add_patch(patches.Rectangle((0, 0), length1, width1, facecolor="lightblue", edgecolor="black"))
-        # Draw the grid lines (tiles)
-        for x in range(length1 + 1):
-            ax1.plot([x, x], [0, width1], color="white", linestyle="-")
-        for y in range(width1 + 1):
-            ax1.plot([0, length1], [y, y], color="white", linestyle="-")
-        ax1.set_xlabel("Length (m)")
-        ax1.set_ylabel("Width (m)")
-        ax1.set_aspect("equal", adjustable="box")
-
-        # --- Room 2: 5x5 ---
-        width2, length2 = 5, 5
-        ax2.set_title("Your Room")
-        # Set plot limits
-        ax2.set_xlim(-0.5, 6.5)
-        ax2.set_ylim(-0.5, 6.5)
-        # Draw the rectangle
-        ax2.add_patch(patches.Rectangle((0, 0), length2, width2, facecolor="lightgreen", edgecolor="black"))
-        # Draw the grid lines (tiles)
-        for x in range(length2 + 1):
-            ax2.plot([x, x], [0, width2], color="white", linestyle="-")
-        for y in range(width2 + 1):
-            ax2.plot([0, length2], [y, y], color="white", linestyle="-")
-        ax2.set_xlabel("Length (m)")
-        ax2.set_aspect("equal", adjustable="box")
-
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        room_comparison_plot = plt.gcf()
+    class FigureCache:
+        """
+        One matplotlib figure per plot, built on first use and updated in place whenever its cell re-runs.
+
+        The figures are created without pyplot, so re-running a cell neither leaks figures into pyplot's global state
+        nor redoes the axes, ticks and layout: a slider change only swaps the plotted data.
+        """
+
+        def __init__(self):
+            self._figures = {}
+
+        def get(self, key, build, **figure_kwargs):
+            """The figure for `key`, and what `build(figure)` returned when it was created (the artists to update)."""
+            if key not in self._figures:
+                from matplotlib.figure import Figure
 
+                figure = Figure(**figure_kwargs)
+                self._figures[key] = (figure, build(figure))
+            return self._figures[key]
+
+    figures = FigureCache()
+    return FigureCache, figures
+
+
+@app.cell
+def __(figures):
+    def visualize_rooms():
+        def build(fig):
+            import matplotlib.patches as patches
+
+            # Create a figure with two subplots
+            ax1, ax2 = fig.subplots(1, 2)
+            fig.suptitle("Visualizing Rooms", fontsize=16)
+
+            # --- Room 1: 4x6 ---
+            width1, length1 = 4, 6
+            ax1.set_title("My Room")
+            # Set plot limits
+            ax1.set_xlim(-0.5, 6.5)
+            ax1.set_ylim(-0.5, 6.5)
+            # Draw the rectangle
+            ax1.add_patch(patches.Rectangle((0, 0), length1, width1, facecolor="lightblue", edgecolor="black"))
+            # Draw the grid lines (tiles)
+            for x in range(length1 + 1):
+                ax1.plot([x, x], [0, width1], color="white", linestyle="-")
+            for y in range(width1 + 1):
+                ax1.plot([0, length1], [y, y], color="white", linestyle="-")
+            ax1.set_xlabel("Length (m)")
+            ax1.set_ylabel("Width (m)")
+            ax1.set_aspect("equal", adjustable="box")
+
+            # --- Room 2: 5x5 ---
+            width2, length2 = 5, 5
+            ax2.set_title("Your Room")
+            # Set plot limits
+            ax2.set_xlim(-0.5, 6.5)
+            ax2.set_ylim(-0.5, 6.5)
+            # Draw the rectangle
+            ax2.add_patch(patches.Rectangle((0, 0), length2, width2, facecolor="lightgreen", edgecolor="black"))
+            # Draw the grid lines (tiles)
+            for x in range(length2 + 1):
+                ax2.plot([x, x], [0, width2], color="white", linestyle="-")
+            for y in range(width2 + 1):
+                ax2.plot([0, length2], [y, y], color="white", linestyle="-")
+            ax2.set_xlabel("Length (m)")
+            ax2.set_aspect("equal", adjustable="box")
+
+            fig.tight_layout(rect=[0, 0.03, 1, 0.95])
+
+        room_comparison_plot, _ = figures.get("rooms", build, figsize=(12, 6))
         return room_comparison_plot
 
     return visualize_rooms
@@ -347,62 +373,62 @@ def __(
 
 
 @app.cell
-def __():
+def __(figures):
     def visualize_my_room_3d():
-        import matplotlib.pyplot as plt
-        from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-
-        # Create the 3D plot
-        fig = plt.figure(figsize=(10, 7))
-        ax = fig.add_subplot(111, projection="3d")
-        ax.set_title("My Room in 3D")
-
-        # Room (4x6x3)
-        x, y, z = 0, 0, 0
-        dx, dy, dz = 4, 6, 3
-        vertices = [[x, y, z], [x + dx, y, z], [x + dx, y + dy, z], [x, y + dy, z], [x, y, z + dz], [x + dx, y, z + dz], [x + dx, y + dy, z + dz], [x, y + dy, z + dz]]
-        faces = [
-            [vertices[j] for j in [0, 1, 2, 3]],
-            [vertices[j] for j in [4, 5, 6, 7]],
-            [vertices[j] for j in [0, 1, 5, 4]],
-            [vertices[j] for j in [2, 3, 7, 6]],
-            [vertices[j] for j in [1, 2, 6, 5]],
-            [vertices[j] for j in [4, 7, 3, 0]],
-        ]
-        ax.add_collection3d(Poly3DCollection(faces, facecolors="lightblue", linewidths=1, edgecolors="black", alpha=0.2))
-
-        # Reference cube (1x1x1)
-        x, y, z = 0, 0, 0
-        dx, dy, dz = 1, 1, 1
-        vertices = [[x, y, z], [x + dx, y, z], [x + dx, y + dy, z], [x, y + dy, z], [x, y, z + dz], [x + dx, y, z + dz], [x + dx, y + dy, z + dz], [x, y + dy, z + dz]]
-        faces = [
-            [vertices[j] for j in [0, 1, 2, 3]],
-            [vertices[j] for j in [4, 5, 6, 7]],
-            [vertices[j] for j in [0, 1, 5, 4]],
-            [vertices[j] for j in [2, 3, 7, 6]],
-            [vertices[j] for j in [1, 2, 6, 5]],
-            [vertices[j] for j in [4, 7, 3, 0]],
-        ]
-        ax.add_collection3d(Poly3DCollection(faces, facecolors="orange", linewidths=1, edgecolors="black", alpha=0.6))
-
-        # Set limits, labels, and aspect
-        ax.set_xlim([0, 4])
-        ax.set_ylim([0, 6])
-        ax.set_zlim([0, 3])
-        ax.set_xlabel("Length (units)")
-        ax.set_ylabel("Width (units)")
-        ax.set_zlabel("Height (units)")
-        ax.set_box_aspect([4, 6, 3])
-
-        # Set the scale of the axes to be 1 and equal
-        ax.set_xticks(range(0, 4, 1))
-        ax.set_yticks(range(0, 6, 1))
-        ax.set_zticks(range(0, 3, 1))
-
-        # Make the plot tight
-        plt.tight_layout()
-
-        return plt.gcf()
+        def build(fig):
+            from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+            # Create the 3D plot
+            ax = fig.add_subplot(111, projection="3d")
+            ax.set_title("My Room in 3D")
+
+            # Room (4x6x3)
+            x, y, z = 0, 0, 0
+            dx, dy, dz = 4, 6, 3
+            vertices = [[x, y, z], [x + dx, y, z], [x + dx, y + dy, z], [x, y + dy, z], [x, y, z + dz], [x + dx, y, z + dz], [x + dx, y + dy, z + dz], [x, y + dy, z + dz]]
+            faces = [
+                [vertices[j] for j in [0, 1, 2, 3]],
+                [vertices[j] for j in [4, 5, 6, 7]],
+                [vertices[j] for j in [0, 1, 5, 4]],
+                [vertices[j] for j in [2, 3, 7, 6]],
+                [vertices[j] for j in [1, 2, 6, 5]],
+                [vertices[j] for j in [4, 7, 3, 0]],
+            ]
+            ax.add_collection3d(Poly3DCollection(faces, facecolors="lightblue", linewidths=1, edgecolors="black", alpha=0.2))
+
+            # Reference cube (1x1x1)
+            x, y, z = 0, 0, 0
+            dx, dy, dz = 1, 1, 1
+            vertices = [[x, y, z], [x + dx, y, z], [x + dx, y + dy, z], [x, y + dy, z], [x, y, z + dz], [x + dx, y, z + dz], [x + dx, y + dy, z + dz], [x, y + dy, z + dz]]
+            faces = [
+                [vertices[j] for j in [0, 1, 2, 3]],
+                [vertices[j] for j in [4, 5, 6, 7]],
+                [vertices[j] for j in [0, 1, 5, 4]],
+                [vertices[j] for j in [2, 3, 7, 6]],
+                [vertices[j] for j in [1, 2, 6, 5]],
+                [vertices[j] for j in [4, 7, 3, 0]],
+            ]
+            ax.add_collection3d(Poly3DCollection(faces, facecolors="orange", linewidths=1, edgecolors="black", alpha=0.6))
+
+            # Set limits, labels, and aspect
+            ax.set_xlim([0, 4])
+            ax.set_ylim([0, 6])
+            ax.set_zlim([0, 3])
+            ax.set_xlabel("Length (units)")
+            ax.set_ylabel("Width (units)")
+            ax.set_zlabel("Height (units)")
+            ax.set_box_aspect([4, 6, 3])
+
+            # Set the scale of the axes to be 1 and equal
+            ax.set_xticks(range(0, 4, 1))
+            ax.set_yticks(range(0, 6, 1))
+            ax.set_zticks(range(0, 3, 1))
+
+            # Make the plot tight
+            fig.tight_layout()
+
+        fig, _ = figures.get("my_room_3d", build, figsize=(10, 7))
+        return fig
 
     return visualize_my_room_3d
 
@@ -579,37 +605,44 @@ def __(mo):
 
 
 @app.cell
-def __(triangle_peak):
+def __(figures, triangle_peak):
     def plot_triangle_and_rectangle():
-        import matplotlib.pyplot as plt
-        from matplotlib.patches import Polygon, Rectangle
-
         base = 6
         height = 4
-        fig, ax = plt.subplots(figsize=(6, 5))
-        # Draw rectangle
-        rect = Rectangle((0, 0), base, height, fill=True, color="lightblue", alpha=0.4)
-        ax.add_patch(rect)
-        # Draw the triangle
-        triangle = Polygon([[0, 0], [base, 0], [triangle_peak.value, height]], closed=True, color="orange", alpha=0.4)
-        ax.add_patch(triangle)
-        # Draw base line
-        ax.plot([0, base], [0, 0], color="black", lw=2)
-        # Draw height line
-        ax.plot([triangle_peak.value, triangle_peak.value], [0, height], color="red", lw=2)
-        # Annotations
-        ax.text(base / 2, -0.5, "base = 6", ha="center", va="top", fontsize=12)
-        ax.text(triangle_peak.value, height / 2, "height = 4", ha="right", va="center", fontsize=12, rotation=90, color="red")
-        # Set limits and aspect
-        ax.set_xlim(-1, base + 1)
-        ax.set_ylim(-1, height + 1)
-        ax.set_aspect("equal")
-        ax.axis("off")
-
-        # Make the plot tight
-        plt.tight_layout()
-
-        return plt.gcf()
+
+        def build(fig):
+            from matplotlib.patches import Polygon, Rectangle
+
+            ax = fig.subplots()
+            # Draw rectangle
+            rect = Rectangle((0, 0), base, height, fill=True, color="lightblue", alpha=0.4)
+            ax.add_patch(rect)
+            # Draw the triangle
+            triangle = Polygon([[0, 0], [base, 0], [0, height]], closed=True, color="orange", alpha=0.4)
+            ax.add_patch(triangle)
+            # Draw base line
+            ax.plot([0, base], [0, 0], color="black", lw=2)
+            # Draw height line
+            (height_line,) = ax.plot([], [], color="red", lw=2)
+            # Annotations
+            ax.text(base / 2, -0.5, "base = 6", ha="center", va="top", fontsize=12)
+            height_label = ax.text(0, height / 2, "height = 4", ha="right", va="center", fontsize=12, rotation=90, color="red")
+            # Set limits and aspect
+            ax.set_xlim(-1, base + 1)
+            ax.set_ylim(-1, height + 1)
+            ax.set_aspect("equal")
+            ax.axis("off")
+
+            # Make the plot tight
+            fig.tight_layout()
+            return triangle, height_line, height_label
+
+        fig, (triangle, height_line, height_label) = figures.get("triangle", build, figsize=(6, 5))
+        # Only the peak moves with the slider.
+        triangle.set_xy([[0, 0], [base, 0], [triangle_peak.value, height]])
+        height_line.set_data([triangle_peak.value, triangle_peak.value], [0, height])
+        height_label.set_x(triangle_peak.value)
+        return fig
 
     return plot_triangle_and_rectangle
 
@@ -669,33 +702,35 @@ def __(mo, plot_triangle_and_rectangle, triangle_peak):
 
 
 @app.cell
-def __(mo):
+def __(figures):
     def visualize_temperature_plot_over_time():
-        import matplotlib.pyplot as plt
-        import numpy as np
-
-        # Generate time data
-        time = np.arange(0, 24, 1)
-        # Generate temperature data
-        temperature = 20 + 10 * np.sin((time - 6) * np.pi / 12)  # Peak at noon, lowest at midnight
-
-        # Add initial and end points at (0,0) and (23,0)
-        time_with_ends = np.concatenate(([0], time, [23]))
-        temperature_with_ends = np.concatenate(([0], temperature, [0]))
-
-        # Create the plot
-        plt.figure(figsize=(10, 5))
-        plt.step(time_with_ends, temperature_with_ends, where="post", color="red")
-        plt.plot(time, temperature, marker="x", linestyle="-", color="blue")
-        plt.title("Temperature Over Time")
-        plt.xlabel("Time (hours)")
-        plt.ylabel("Temperature (°C)")
-        plt.xticks(np.arange(0, 25, 1))
-        plt.yticks(np.arange(0, 31, 1))
-        plt.grid(True)
-        plt.tight_layout()
+        def build(fig):
+            import numpy as np
+
+            # Generate time data
+            time = np.arange(0, 24, 1)
+            # Generate temperature data
+            temperature = 20 + 10 * np.sin((time - 6) * np.pi / 12)  # Peak at noon, lowest at midnight
+
+            # Add initial and end points at (0,0) and (23,0)
+            time_with_ends = np.concatenate(([0], time, [23]))
+            temperature_with_ends = np.concatenate(([0], temperature, [0]))
+
+            # Create the plot
+            ax = fig.subplots()
+            ax.step(time_with_ends, temperature_with_ends, where="post", color="red")
+            ax.plot(time, temperature, marker="x", linestyle="-", color="blue")
+            ax.set_title("Temperature Over Time")
+            ax.set_xlabel("Time (hours)")
+            ax.set_ylabel("Temperature (°C)")
+            ax.set_xticks(np.arange(0, 25, 1))
+            ax.set_yticks(np.arange(0, 31, 1))
+            ax.grid(True)
+            fig.tight_layout()
+
         # Return the plot
-        return plt.gcf()
+        fig, _ = figures.get("temperature", build, figsize=(10, 5))
+        return fig
 
     return visualize_temperature_plot_over_time
 
@@ -41,6 +41,54 @@ def __():
     return get_function_latex
 
 
+@app.cell
+def __():
+    def horner(coefficients, x):
+        """Evaluate the polynomial with the given coefficients (highest degree first) at every point of the array x."""
+        import numpy as np
+
+        y = np.zeros_like(x, dtype=float)
+        for c in coefficients:
+            y *= x
+            y += c
+        return y
+
+    def polynomial_curve(coefficients, x_min, x_max, resolution=2001):
+        """Sample the polynomial on `resolution` evenly spaced points between x_min and x_max."""
+        import numpy as np
+
+        x = np.linspace(x_min, x_max, resolution)
+        return x, horner(coefficients, x)
+
+    return horner, polynomial_curve
+
+
+@app.cell
+def __():
+    class FigureCache:
+        """
+        One matplotlib figure per plot, built on first use and updated in place whenever its cell re-runs.
+
+        The figures are created without pyplot, so re-running a cell neither leaks figures into pyplot's global state
+        nor redoes the axes, ticks and layout: a slider change only swaps the plotted data.
+        """
+
+        def __init__(self):
+            self._figures = {}
+
+        def get(self, key, build, **figure_kwargs):
+            """The figure for `key`, and what `build(figure)` returned when it was created (the artists to update)."""
+            if key not in self._figures:
+                from matplotlib.figure import Figure
+
+                figure = Figure(**figure_kwargs)
+                self._figures[key] = (figure, build(figure))
+            return self._figures[key]
+
+    figures = FigureCache()
+    return FigureCache, figures
+
+
 @app.cell
 def __(mo):
     mo.md(
@@ -177,24 +225,26 @@ def __(mo):
 
 
 @app.cell
-def __(a3_slider, a2_slider, a1_slider, a0_slider):
+def __(a3_slider, a2_slider, a1_slider, a0_slider, figures, polynomial_curve):
     def construct_polynomial_function_plot():
-        import matplotlib.pyplot as plt
-
-        plt.axes()
-        x = range(-100, 100)
-        y = [a3_slider.value * (i**3) + a2_slider.value * (i**2) + a1_slider.value * i + a0_slider.value for i in x]
-        plt.plot(x, y, label=f"f(x) = {a3_slider.value}x³ {a2_slider.value}x² + {a1_slider.value}x + {a0_slider.value}")
-        plt.title("Function Plot")
-        plt.xlabel("x")
-        plt.ylabel("f(x)")
-        plt.grid()
-        # Keep the aspect ratio of the plot square
-        plt.xlim(-100, 100)
-        plt.ylim(-100, 100)
-        plt.axhline(0, color="black", lw=0.5, ls="--")
-        plt.axvline(0, color="black", lw=0.5, ls="--")
-        return plt.gca()
+        def build(figure):
+            ax = figure.add_subplot()
+            (line,) = ax.plot([], [])
+            ax.set_title("Function Plot")
+            ax.set_xlabel("x")
+            ax.set_ylabel("f(x)")
+            ax.grid()
+            # Keep the aspect ratio of the plot square
+            ax.set_xlim(-100, 100)
+            ax.set_ylim(-100, 100)
+            ax.axhline(0, color="black", lw=0.5, ls="--")
+            ax.axvline(0, color="black", lw=0.5, ls="--")
+            return line
+
+        figure, line = figures.get("polynomial", build)
+        line.set_data(*polynomial_curve((a3_slider.value, a2_slider.value, a1_slider.value, a0_slider.value), -100, 100))
+        line.set_label(f"f(x) = {a3_slider.value}x³ {a2_slider.value}x² + {a1_slider.value}x + {a0_slider.value}")
+        return figure.axes[0]
 
     return (construct_polynomial_function_plot,)
 
@@ -248,24 +298,27 @@ def __(mo):
 
 
 @app.cell
-def __():
+def __(figures, horner):
     def construct_local_cafe_function_plot():
-        import matplotlib.pyplot as plt
-
-        plt.axes()
-        x = range(0, 10)
-        y = [2 * i + 10 for i in x]
-        plt.scatter(x, y, label="f(x) = 2x + 10", color="blue")
-        plt.title("Café Earnings Function")
-        plt.xlabel("Number of Customers")
-        plt.ylabel("Earnings (€)")
-        plt.grid()
-        plt.xlim(0, 10)
-        plt.ylim(0, 31)
-        # Show increment of 1 on x-axis and 2 on y-axis
-        plt.xticks(range(0, 11))
-        plt.yticks(range(0, 31, 2))
-        return plt.gca()
+        def build(figure):
+            import numpy as np
+
+            ax = figure.add_subplot()
+            x = np.arange(0, 10)
+            y = horner((2, 10), x)
+            ax.scatter(x, y, label="f(x) = 2x + 10", color="blue")
+            ax.set_title("Café Earnings Function")
+            ax.set_xlabel("Number of Customers")
+            ax.set_ylabel("Earnings (€)")
+            ax.grid()
+            ax.set_xlim(0, 10)
+            ax.set_ylim(0, 31)
+            # Show increment of 1 on x-axis and 2 on y-axis
+            ax.set_xticks(range(0, 11))
+            ax.set_yticks(range(0, 31, 2))
+
+        figure, _ = figures.get("cafe", build)
+        return figure.axes[0]
 
     return (construct_local_cafe_function_plot,)
 
@@ -324,29 +377,34 @@ def __(mo):
 
 
 @app.cell
-def __(lf_a1_slider, lf_a0_slider):
+def __(lf_a1_slider, lf_a0_slider, figures, polynomial_curve):
     def construct_linear_function_plot():
-        import matplotlib.pyplot as plt
-
-        plt.axes()
-        x = range(-100, 100)
-        y = [lf_a1_slider.value * i + lf_a0_slider.value for i in x]
-        plt.plot(x, y, label=f"f(x) = {lf_a1_slider.value}x + {lf_a0_slider.value}")
-        plt.title("Function Plot")
-        plt.xlabel("x")
-        plt.ylabel("f(x)")
-        plt.grid()
-        # Keep the aspect ratio of the plot square
-        plt.xlim(-100, 100)
-        plt.ylim(-100, 100)
-        plt.axhline(0, color="black", lw=0.5, ls="--")
-        plt.axvline(0, color="black", lw=0.5, ls="--")
-        plt.xticks(range(-100, 100, 10))
-        plt.yticks(range(-100, 100, 10))
-        # Highlight the y-intercept point in red
-        plt.scatter(0, lf_a0_slider.value, color="red", label=f"offset (b) = {lf_a0_slider.value}")
-        plt.legend()
-        return plt.gca()
+        def build(figure):
+            ax = figure.add_subplot()
+            (line,) = ax.plot([], [])
+            ax.set_title("Function Plot")
+            ax.set_xlabel("x")
+            ax.set_ylabel("f(x)")
+            ax.grid()
+            # Keep the aspect ratio of the plot square
+            ax.set_xlim(-100, 100)
+            ax.set_ylim(-100, 100)
+            ax.axhline(0, color="black", lw=0.5, ls="--")
+            ax.axvline(0, color="black", lw=0.5, ls="--")
+            ax.set_xticks(range(-100, 100, 10))
+            ax.set_yticks(range(-100, 100, 10))
+            # Highlight the y-intercept point in red
+            offset = ax.scatter([0], [0], color="red")
+            return line, offset
+
+        figure, (line, offset) = figures.get("linear", build)
+        line.set_data(*polynomial_curve((lf_a1_slider.value, lf_a0_slider.value), -100, 100))
+        line.set_label(f"f(x) = {lf_a1_slider.value}x + {lf_a0_slider.value}")
+        offset.set_offsets([[0, lf_a0_slider.value]])
+        offset.set_label(f"offset (b) = {lf_a0_slider.value}")
+        # The labels changed, so the legend is the one part that is redrawn.
+        figure.axes[0].legend()
+        return figure.axes[0]
 
     return (construct_linear_function_plot,)
 
@@ -578,44 +636,38 @@ def __():
 
 
 @app.cell
-def __(end_portal_spot1, end_portal_drop1, end_portal_spot2, end_portal_drop2, end_portal_m1, end_portal_b1, end_portal_m2, end_portal_b2):
+def __(end_portal_spot1, end_portal_drop1, end_portal_spot2, end_portal_drop2, end_portal_m1, end_portal_b1, end_portal_m2, end_portal_b2, figures, polynomial_curve):
     def construct_minecraft_find_end_portal_function_plot():
-        import matplotlib.pyplot as plt
-        import numpy as np
+        def build(figure):
+            # Find intersection (x_int, z_int) by setting m1*x + b1 = m2*x + b2
+            x_int = (end_portal_b2 - end_portal_b1) / (end_portal_m1 - end_portal_m2)
+            z_int = end_portal_m1 * x_int + end_portal_b1
+            intersection_label = f"Intersection ~ ({x_int:.0f}, {z_int:.0f})"
 
-        # Find intersection (x_int, z_int) by setting m1*x + b1 = m2*x + b2
-        x_int = (end_portal_b2 - end_portal_b1) / (end_portal_m1 - end_portal_m2)
-        z_int = end_portal_m1 * x_int + end_portal_b1
-        intersection_label = f"Intersection ~ ({x_int:.0f}, {z_int:.0f})"
+            ax = figure.add_subplot()
 
-        # Prepare data for plotting
-        x_vals = np.linspace(100, 400, 300)
-        z1_vals = end_portal_m1 * x_vals + end_portal_b1
-        z2_vals = end_portal_m2 * x_vals + end_portal_b2
+            # Plot the two lines
+            ax.plot(*polynomial_curve((end_portal_m1, end_portal_b1), 100, 400, resolution=300), color="blue", linestyle="--")
+            ax.plot(*polynomial_curve((end_portal_m2, end_portal_b2), 100, 400, resolution=300), color="purple", linestyle="--")
 
-        plt.axes()
+            # Mark vantage and drop points
+            ax.scatter([end_portal_spot1[0]], [end_portal_spot1[1]], zorder=5, color="green", marker="x", label="First spot")
+            ax.scatter([end_portal_spot2[0]], [end_portal_spot2[1]], zorder=5, color="green", marker="x", label="Second spot")
+            ax.scatter([end_portal_drop1[0]], [end_portal_drop1[1]], zorder=5, color="orange", marker="o", label="First drop")
+            ax.scatter([end_portal_drop2[0]], [end_portal_drop2[1]], zorder=5, color="orange", marker="o", label="Second drop")
 
-        # Plot the two lines
-        plt.plot(x_vals, z1_vals, color="blue", linestyle="--")
-        plt.plot(x_vals, z2_vals, color="purple", linestyle="--")
+            # Mark the intersection (if it exists)
+            if x_int is not None and z_int is not None:
+                ax.scatter([x_int], [z_int], color="red", zorder=5, label=intersection_label)
 
-        # Mark vantage and drop points
-        plt.scatter([end_portal_spot1[0]], [end_portal_spot1[1]], zorder=5, color="green", marker="x", label="First spot")
-        plt.scatter([end_portal_spot2[0]], [end_portal_spot2[1]], zorder=5, color="green", marker="x", label="Second spot")
-        plt.scatter([end_portal_drop1[0]], [end_portal_drop1[1]], zorder=5, color="orange", marker="o", label="First drop")
-        plt.scatter([end_portal_drop2[0]], [end_portal_drop2[1]], zorder=5, color="orange", marker="o", label="Second drop")
+            ax.set_title("Minecraft - Locate the End Portal")
+            ax.set_xlabel("x (East-West coordinate)")
+            ax.set_ylabel("z (North-South coordinate)")
+            ax.grid(True)
+            ax.legend()
 
-        # Mark the intersection (if it exists)
-        if x_int is not None and z_int is not None:
-            plt.scatter([x_int], [z_int], color="red", zorder=5, label=intersection_label)
-
-        plt.title("Minecraft - Locate the End Portal")
-        plt.xlabel("x (East-West coordinate)")
-        plt.ylabel("z (North-South coordinate)")
-        plt.grid(True)
-        plt.legend()
-
-        return plt.gca()
+        figure, _ = figures.get("end_portal", build)
+        return figure.axes[0]
 
     return (construct_minecraft_find_end_portal_function_plot,)
 
@@ -688,10 +740,8 @@ def __(run_button):
 
 
 @app.cell
-def __(exercise_a1_slider, exercise_a0_slider, exercise_x1, exercise_y1, exercise_x2, exercise_y2):
+def __(exercise_a1_slider, exercise_a0_slider, exercise_x1, exercise_y1, exercise_x2, exercise_y2, figures, polynomial_curve):
     def construct_exercise_function_plot():
-        import matplotlib.pyplot as plt
-
         a1 = exercise_a1_slider.value
         a0 = exercise_a0_slider.value
 
@@ -702,23 +752,29 @@ def __(exercise_a1_slider, exercise_a0_slider, exercise_x1, exercise_y1, exercis
         # Use green if both points lie on the line, else use default color
         line_color = "green" if passes_point1 and passes_point2 else "blue"
 
-        plt.axes()
-        x = range(-100, 100)
-        y = [a1 * i + a0 for i in x]
-        plt.plot(x, y, color=line_color, label=f"f(x) = {a1}x + {a0}")
-        plt.title("Function Plot")
-        plt.xlabel("x")
-        plt.ylabel("f(x)")
-        plt.grid()
-        plt.xlim(-100, 100)
-        plt.ylim(-100, 100)
-        plt.axhline(0, color="black", lw=0.5, ls="--")
-        plt.axvline(0, color="black", lw=0.5, ls="--")
-        plt.xticks(range(-100, 100, 10))
-        plt.yticks(range(-100, 100, 10))
-        plt.scatter([exercise_x1, exercise_x2], [exercise_y1, exercise_y2], color="red", label="Points")
-        plt.legend()
-        return plt.gca()
+        def build(figure):
+            ax = figure.add_subplot()
+            (line,) = ax.plot([], [])
+            ax.set_title("Function Plot")
+            ax.set_xlabel("x")
+            ax.set_ylabel("f(x)")
+            ax.grid()
+            ax.set_xlim(-100, 100)
+            ax.set_ylim(-100, 100)
+            ax.axhline(0, color="black", lw=0.5, ls="--")
+            ax.axvline(0, color="black", lw=0.5, ls="--")
+            ax.set_xticks(range(-100, 100, 10))
+            ax.set_yticks(range(-100, 100, 10))
+            points = ax.scatter([], [], color="red", label="Points")
+            return line, points
+
+        figure, (line, points) = figures.get("exercise", build)
+        line.set_data(*polynomial_curve((a1, a0), -100, 100))
+        line.set_color(line_color)
+        line.set_label(f"f(x) = {a1}x + {a0}")
+        points.set_offsets([[exercise_x1, exercise_y1], [exercise_x2, exercise_y2]])
+        figure.axes[0].legend()
+        return figure.axes[0]
 
     return (construct_exercise_function_plot,)
 
@@ -84,14 +84,219 @@ def _():
     import pandas as pd
     import plotly.express as px
     import plotly.graph_objects as go
-    from scipy import stats
-    from scipy.stats import kurtosis, skew
+    from scipy import special, stats
 
-    return dataclass, go, io, kurtosis, np, pd, plt, px, skew, stats
+    return dataclass, go, io, np, pd, plt, px, special, stats
 
 
 @app.cell
-def _(dataclass, kurtosis, np, skew):
+def _(dataclass, np):
+    @dataclass
+    class ColumnStats:
+        """Descriptive statistics of every column of a 2-D array, one array per measure (NaNs are ignored)."""
+
+        count: np.ndarray
+        mean: np.ndarray
+        std: np.ndarray
+        cv: np.ndarray
+        min_val: np.ndarray
+        q1: np.ndarray
+        median: np.ndarray
+        q3: np.ndarray
+        max_val: np.ndarray
+        skewness: np.ndarray
+        kurtosis: np.ndarray
+
+        @property
+        def iqr(self) -> np.ndarray:
+            return self.q3 - self.q1
+
+        def to_dict(self) -> dict:
+            """Measures keyed like `DescriptiveStats.to_dict`, ready for a DataFrame with one row per column."""
+            return {
+                "count": self.count,
+                "mean": self.mean,
+                "std": self.std,
+                "cv": self.cv,
+                "min": self.min_val,
+                "25%": self.q1,
+                "50%": self.median,
+                "75%": self.q3,
+                "max": self.max_val,
+                "skewness": self.skewness,
+                "kurtosis": self.kurtosis,
+            }
+
+    def column_quantiles(matrix, count, quantiles):
+        """
+        Quantiles of each column (linear interpolation, like np.percentile) from a single sort of the matrix.
+
+        NaNs sort to the end, so the valid values of a column occupy its first `count` rows in order.
+        Returns one row per quantile.
+        """
+        positions = np.multiply.outer(quantiles, np.maximum(count - 1, 0))
+        if not len(matrix):
+            return np.zeros(positions.shape)
+        lower = np.floor(positions).astype(np.intp)
+        upper = np.minimum(lower + 1, np.maximum(count - 1, 0))
+        # One vectorised sort beats np.partition here: with NaNs the columns need different kth positions
+        ordered = np.sort(matrix, axis=0)
+        columns = np.arange(matrix.shape[1])
+        below, above = ordered[lower, columns], ordered[upper, columns]
+        return below + (positions - lower) * (above - below)
+
+    SUMMARY_QUANTILES = np.array([0.0, 0.25, 0.5, 0.75, 1.0])  # min, Q1, median, Q3, max
+
+    def central_moments(matrix):
+        """Count, mean and the central moment sums M2, M3, M4 of every column, ignoring NaNs."""
+        invalid = np.isnan(matrix)
+        count = len(matrix) - invalid.sum(axis=0)
+        # Centre one zero-filled copy in place; einsum avoids the product temporaries
+        centred = np.where(invalid, 0.0, matrix)
+        mean = centred.sum(axis=0) / np.maximum(count, 1)
+        centred -= mean
+        centred[invalid] = 0.0
+        squared = centred * centred
+        return count, mean, squared.sum(axis=0), np.einsum("ij,ij->j", squared, centred), np.einsum("ij,ij->j", squared, squared)
+
+    def stats_from_moments(count, mean, m2, m3, m4, quantiles) -> ColumnStats:
+        """
+        ColumnStats from per-column moment sums and the rows of `SUMMARY_QUANTILES`.
+
+        Matches the per-column NumPy/SciPy calls: sample std (ddof=1), biased skewness and Fisher kurtosis
+        (scipy.stats defaults), NaN when undefined. Columns without any valid value get all zeros.
+        """
+        n = np.maximum(count, 1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(m2 / (count - 1))
+            # scipy.stats returns NaN for the shape of (numerically) constant data
+            constant = m2 / n <= (np.finfo(float).eps * mean) ** 2
+            skewness = np.where(constant, np.nan, (m3 / n) / (m2 / n) ** 1.5)
+            kurtosis = np.where(constant, np.nan, (m4 / n) / (m2 / n) ** 2 - 3.0)
+            cv = np.where(mean != 0, std / mean * 100, 0.0)
+        min_val, q1, median, q3, max_val = quantiles
+
+        empty = count == 0
+        return ColumnStats(
+            count,
+            *(np.where(empty, 0.0, measure) for measure in (mean, std, cv, min_val, q1, median, q3, max_val, skewness, kurtosis)),
+        )
+
+    def describe_columns(matrix) -> ColumnStats:
+        """Count, moments, range and quartiles of every column of `matrix` (rows = samples) in one vectorised pass."""
+        matrix = np.asarray(matrix, dtype=float)
+        if matrix.ndim == 1:
+            matrix = matrix[:, np.newaxis]
+        count, *moments = central_moments(matrix)
+        return stats_from_moments(count, *moments, column_quantiles(matrix, count, SUMMARY_QUANTILES))
+
+    return SUMMARY_QUANTILES, central_moments, column_quantiles, describe_columns, stats_from_moments
+
+
+@app.cell
+def _(SUMMARY_QUANTILES, central_moments, column_quantiles, dataclass, io, np, pd, stats_from_moments):
+    @dataclass
+    class RunningMoments:
+        """Count, mean and central moment sums M2, M3, M4 of every column, combined chunk by chunk."""
+
+        count: np.ndarray
+        mean: np.ndarray
+        m2: np.ndarray
+        m3: np.ndarray
+        m4: np.ndarray
+
+        @classmethod
+        def of(cls, chunk) -> "RunningMoments":
+            return cls(*central_moments(chunk))
+
+        def merge(self, other: "RunningMoments") -> "RunningMoments":
+            """The moments of both parts together (Pébay's pairwise update, Welford's for a single value)."""
+            na, nb = self.count.astype(float), other.count.astype(float)
+            n = na + nb
+            delta = other.mean - self.mean
+            d = np.divide(delta, n, out=np.zeros_like(delta), where=n > 0)
+            m2 = self.m2 + other.m2 + delta * d * na * nb
+            m3 = self.m3 + other.m3 + delta * d**2 * na * nb * (na - nb) + 3 * d * (na * other.m2 - nb * self.m2)
+            m4 = (
+                self.m4
+                + other.m4
+                + delta * d**3 * na * nb * (na * na - na * nb + nb * nb)
+                + 6 * d**2 * (na * na * other.m2 + nb * nb * self.m2)
+                + 4 * d * (na * other.m3 - nb * self.m3)
+            )
+            return RunningMoments(self.count + other.count, self.mean + nb * d, m2, m3, m4)
+
+    @dataclass
+    class StreamedColumns:
+        """Columns read by `stream_csv`: the labels of the first one, the values and statistics of the others."""
+
+        labels: list
+        values: np.ndarray  # rows x numeric columns, column-major
+        column_stats: object  # ColumnStats
+        rows: int
+
+    def stream_csv(source: bytes, label_column: int, value_columns: list[int], chunksize: int = 50_000) -> StreamedColumns:
+        """
+        Read the columns at the given positions of a CSV chunk by chunk, with running statistics of the numeric ones.
+
+        Only these columns are parsed and kept, as floats, so the whole table is never held as a DataFrame.
+        The moments are merged chunk by chunk; the quantiles are exact, from one sort of the kept values.
+        Values that are not numbers become NaN.
+        """
+        positions = sorted({label_column, *value_columns})
+        labels, chunks = [], []
+        moments = RunningMoments(*central_moments(np.empty((0, len(value_columns)))))
+        for frame in pd.read_csv(io.BytesIO(source), usecols=positions, chunksize=chunksize):
+            labels.extend(frame.iloc[:, positions.index(label_column)].tolist())
+            chunk = np.empty((len(frame), len(value_columns)))
+            for j, column in enumerate(value_columns):
+                chunk[:, j] = pd.to_numeric(frame.iloc[:, positions.index(column)], errors="coerce")
+            chunks.append(chunk)
+            moments = moments.merge(RunningMoments.of(chunk))
+        # Column-major, so that each column is one contiguous block
+        values = np.empty((len(labels), len(value_columns)), order="F")
+        if chunks:
+            np.concatenate(chunks, out=values)
+        quantiles = column_quantiles(values, moments.count, SUMMARY_QUANTILES)
+        column_stats = stats_from_moments(moments.count, moments.mean, moments.m2, moments.m3, moments.m4, quantiles)
+        return StreamedColumns(labels, values, column_stats, len(labels))
+
+    return (stream_csv,)
+
+
+@app.cell
+def _(dataclass, describe_columns, np):
+    class ParameterStore:
+        """
+        The values of all parameters as the columns of one float64 matrix, with their validity mask computed once.
+
+        The matrix is column-major, so a parameter's values are a contiguous, zero-copy view. Its non-NaN values
+        are filtered once and cached. Both are read-only: the cells share them.
+        """
+
+        def __init__(self, names, matrix):
+            self.names = list(names)
+            self.matrix = np.asfortranarray(matrix, dtype=float).reshape(len(matrix), len(self.names), order="F")
+            self.matrix.flags.writeable = False
+            self.valid = ~np.isnan(self.matrix)
+            self.counts = self.valid.sum(axis=0)
+            self._columns = {name: i for i, name in enumerate(self.names)}
+            self._valid_values = {}
+
+        def values(self, name) -> np.ndarray:
+            return self.matrix[:, self._columns[name]]
+
+        def valid_values(self, name) -> np.ndarray:
+            if name not in self._valid_values:
+                i = self._columns[name]
+                valid_values = self.matrix[self.valid[:, i], i]
+                valid_values.flags.writeable = False
+                self._valid_values[name] = valid_values
+            return self._valid_values[name]
+
+        def count(self, name) -> int:
+            return int(self.counts[self._columns[name]])
+
     @dataclass
     class ParameterData:
         """Holds information about a single parameter."""
@@ -100,15 +305,29 @@ def _(dataclass, kurtosis, np, skew):
         units: str  # Units of the parameter (e.g., "%", "kJ/g")
         description: str  # Brief parameter description
         values: np.ndarray  # Actual measurement values
+        store: ParameterStore = None  # store the values are a column of, if any
+
+        @classmethod
+        def from_store(cls, store: ParameterStore, name: str, units: str, description: str) -> "ParameterData":
+            return cls(name, units, description, store.values(name), store)
 
         @property
         def display_name(self) -> str:
             """Display name with units (e.g., "Residue (%)")."""
             return f"{self.name} ({self.units})" if self.units else self.name
 
+        @property
+        def valid_values(self) -> np.ndarray:
+            """The non-NaN values, filtered once per store (read-only)."""
+            if self.store is not None:
+                return self.store.valid_values(self.name)
+            return self.values[~np.isnan(self.values)]
+
         @property
         def count(self) -> int:
             """Number of non-NaN values."""
+            if self.store is not None:
+                return self.store.count(self.name)
             return int(np.sum(~np.isnan(self.values)))
 
         @property
@@ -121,45 +340,50 @@ def _(dataclass, kurtosis, np, skew):
         """Calculates and stores descriptive statistics for a parameter."""
 
         parameter: ParameterData
+        column_stats: object = None  # ColumnStats the parameter is a column of; computed for it alone if None
+        column: int = 0
 
         def __post_init__(self):
             """Calculate all statistics after initialization."""
             self._calculate_stats()
 
+        @classmethod
+        def for_parameters(cls, parameters, column_stats=None) -> dict:
+            """Statistics of all parameters, from `column_stats` (one column per parameter) or one batched pass over their values."""
+            if not parameters:
+                return {}
+            if column_stats is None:
+                store = parameters[0].store
+                same_store = store is not None and [p.name for p in parameters] == store.names
+                column_stats = describe_columns(store.matrix if same_store else np.column_stack([p.values for p in parameters]))
+            return {p.name: cls(p, column_stats, i) for i, p in enumerate(parameters)}
+
         def _calculate_stats(self):
-            """Compute all statistical measures."""
-            vals = self.parameter.values[~np.isnan(self.parameter.values)]
-
-            if len(vals) == 0:
-                # Set defaults for empty data
-                self.mean = self.median = self.std = 0.0
-                self.min_val = self.max_val = 0.0
-                self.q1 = self.q3 = 0.0
-                self.skewness = self.kurtosis = 0.0
-                self.cv = 0.0
-                self.iqr = 0.0
-                return
+            """Pick this parameter's measures out of the column statistics."""
+            if self.column_stats is None:
+                self.column_stats = describe_columns(self.parameter.values)
+            s, i = self.column_stats, self.column
 
             # Central tendency
-            self.mean = float(np.mean(vals))
-            self.median = float(np.median(vals))
-            self.std = float(np.std(vals, ddof=1))  # Sample std dev
+            self.mean = float(s.mean[i])
+            self.median = float(s.median[i])
+            self.std = float(s.std[i])  # Sample std dev
 
             # Range
-            self.min_val = float(np.min(vals))
-            self.max_val = float(np.max(vals))
+            self.min_val = float(s.min_val[i])
+            self.max_val = float(s.max_val[i])
 
             # Quartiles
-            self.q1 = float(np.percentile(vals, 25))
-            self.q3 = float(np.percentile(vals, 75))
+            self.q1 = float(s.q1[i])
+            self.q3 = float(s.q3[i])
             self.iqr = self.q3 - self.q1
 
             # Distribution shape
-            self.skewness = float(skew(vals))
-            self.kurtosis = float(kurtosis(vals))
+            self.skewness = float(s.skewness[i])
+            self.kurtosis = float(s.kurtosis[i])
 
             # Coefficient of variation
-            self.cv = (self.std / self.mean * 100) if self.mean != 0 else 0.0
+            self.cv = float(s.cv[i])
 
         def get_variability_text(self) -> str:
             """Interpret variability based on CV."""
@@ -216,7 +440,7 @@ def _(dataclass, kurtosis, np, skew):
                 "kurtosis": self.kurtosis,
             }
 
-    return DescriptiveStats, ParameterData
+    return DescriptiveStats, ParameterData, ParameterStore
 
 
 @app.cell
@@ -242,7 +466,7 @@ def _(mo):
 
 
 @app.cell
-def _(ParameterData, file_upload, io, np, pd):
+def _(ParameterData, ParameterStore, file_upload, io, pd, stream_csv):
     # Default example data - Fire-starter briquettes MCC measurements
     default_data = """Sample,Residue,THR,HRC,Time1
         A,7.69,13.56,157.13,151.5
@@ -261,36 +485,19 @@ def _(ParameterData, file_upload, io, np, pd):
 
     # Use uploaded file if available, otherwise use default
     if file_upload.value:
-        df = pd.read_csv(io.BytesIO(file_upload.value[0].contents))
+        csv_data = file_upload.value[0].contents
         data_source = "Uploaded CSV"
     else:
-        df = pd.read_csv(io.StringIO(default_data))
+        csv_data = default_data.encode()
         data_source = "Example dataset (MCC fire-starter briquettes)"
 
-    # Clean column names
-    df.columns = df.columns.str.strip()
+    # Read only the header first; the rows are streamed below, one chunk at a time
+    columns = pd.read_csv(io.BytesIO(csv_data), nrows=0).columns.str.strip().tolist()
 
     # Validate that we have at least 2 columns (Sample + at least 1 parameter)
-    if len(df.columns) < 2:
+    if len(columns) < 2:
         raise ValueError("CSV file must have at least 2 columns (Sample column + parameter columns)")
 
-    # Validate that we have at least 1 row of data
-    if len(df) == 0:
-        raise ValueError("CSV file is empty - no data rows found")
-
-    # Extract sample information before processing parameters
-    sample_names = df.iloc[:, 0].tolist()
-    num_samples = len(df)
-
-    # Display info
-    print(f"📊 Data source: {data_source}")
-    print(f"📏 Dataset shape: {df.shape}")
-    print(f"🔢 Number of samples: {num_samples}")
-    print(f"📈 Parameters: {', '.join(df.columns[1:].tolist())}")
-
-    # Create ParameterData objects for each parameter column (skip first column which is Sample)
-    parameters_data = []
-
     # Default parameter metadata for MCC dataset
     param_metadata = {
         "Residue": {"units": "%", "description": "Combustion efficiency (lower = better)"},
@@ -299,46 +506,59 @@ def _(ParameterData, file_upload, io, np, pd):
         "Time1": {"units": "s", "description": "Time to ignition (lower = faster ignition)"},
     }
 
-    # Process each known parameter and find matching column
-    for param_name, metadata in param_metadata.items():
-        # Find column that contains this parameter name (case-insensitive)
-        matching_col = None
-        for col in df.columns[1:]:  # Skip first column (Sample)
-            if param_name.lower() in col.lower():
-                matching_col = col
-                break
-
+    # Find the column that contains each known parameter name (case-insensitive), skipping the first (Sample)
+    matched_params = {}
+    for param_name in param_metadata:
+        matching_col = next((i for i, col in enumerate(columns) if i > 0 and param_name.lower() in col.lower()), None)
         # If no matching column found, skip this parameter
-        if matching_col is None:
-            continue
-
-        # Try to get numeric values, skip if column can't be converted to numeric
-        try:
-            values = pd.to_numeric(df[matching_col], errors="coerce").values
-        except Exception:
-            print(f"⚠️ Skipping parameter '{param_name}' (column '{matching_col}') - cannot convert to numeric values")
-            continue
-
-        parameters_data.append(
-            ParameterData(
-                name=param_name,  # Use the standardized parameter name
-                units=metadata["units"],
-                description=metadata["description"],
-                values=values,
-            )
+        if matching_col is not None:
+            matched_params[param_name] = matching_col
+
+    # Stream the sample column and the matched parameter columns; non-numeric values become NaN
+    streamed = stream_csv(csv_data, 0, list(matched_params.values()))
+
+    # Validate that we have at least 1 row of data
+    if streamed.rows == 0:
+        raise ValueError("CSV file is empty - no data rows found")
+
+    # Extract sample information
+    sample_names = streamed.labels
+    num_samples = streamed.rows
+
+    # Display info
+    print(f"📊 Data source: {data_source}")
+    print(f"📏 Dataset shape: {(num_samples, len(columns))}")
+    print(f"🔢 Number of samples: {num_samples}")
+    print(f"📈 Parameters: {', '.join(columns[1:])}")
+
+    # Keep all parameter values in one columnar store, under the standardized parameter names
+    parameter_store = ParameterStore(matched_params, streamed.values)
+
+    # Create ParameterData objects for each matched parameter column, viewing into the store
+    parameters_data = [
+        ParameterData.from_store(
+            parameter_store,
+            param_name,
+            units=param_metadata[param_name]["units"],
+            description=param_metadata[param_name]["description"],
         )
-    return data_source, num_samples, parameters_data, sample_names
+        for param_name in matched_params
+    ]
+    # Statistics gathered while streaming, one column per entry of parameters_data
+    loaded_stats = streamed.column_stats
+    return data_source, loaded_stats, num_samples, parameter_store, parameters_data, sample_names
 
 
 @app.cell
-def _(parameters_data, DescriptiveStats, ParameterData):
-    # Calculate descriptive statistics for each parameter
-    param_stats: dict[str, DescriptiveStats] = {param_data.name: DescriptiveStats(param_data) for param_data in parameters_data}
+def _(parameters_data, DescriptiveStats, ParameterData, loaded_stats):
+    # Descriptive statistics for all parameters, as gathered while loading the data
+    param_stats: dict[str, DescriptiveStats] = DescriptiveStats.for_parameters(parameters_data, loaded_stats)
+    column_stats = loaded_stats
 
     # Create a convenience dictionary for accessing parameters by name
     parameters: dict[str, ParameterData] = {p.name: p for p in parameters_data}
 
-    return param_stats, parameters
+    return column_stats, param_stats, parameters
 
 
 @app.cell
@@ -450,13 +670,9 @@ def _(mo):
 
 
 @app.cell
-def _(param_stats, pd):
-    # Create descriptive statistics table from DescriptiveStats objects
-    stats_dict = {}
-    for _param_name, stats_obj in param_stats.items():
-        stats_dict[_param_name] = stats_obj.to_dict()
-
-    desc_stats = pd.DataFrame(stats_dict).T
+def _(column_stats, param_stats, pd):
+    # Create descriptive statistics table from the column statistics, one row per parameter
+    desc_stats = pd.DataFrame(column_stats.to_dict(), index=list(param_stats))
     desc_stats = desc_stats.round(3)
     # Display the descriptive statistics table
     desc_stats  # noqa: B018
@@ -475,7 +691,7 @@ def _(mo):
 
 
 @app.cell
-def _(np):
+def _():
     # Helper functions for parameter analysis
     def create_parameter_histogram(param_display, param_values, stats_obj, go):
         """
@@ -483,19 +699,17 @@ def _(np):
 
         Arguments:
             param_display: Display name with units (e.g., "Residue (%)")
-            param_values: numpy array of values
+            param_values: numpy array of the non-NaN values
             stats_obj: DescriptiveStats object containing statistics
             go: plotly.graph_objects module
 
         """
-        data_vals = param_values[~np.isnan(param_values)]
-
         fig = go.Figure()
 
         # Histogram
         fig.add_trace(
             go.Histogram(
-                x=data_vals,
+                x=param_values,
                 name="Distribution",
                 nbinsx=10,
                 marker={"color": "lightblue", "line": {"color": "darkblue", "width": 1}},
@@ -557,7 +771,7 @@ def _(create_parameter_histogram, go, mo, param_stats, parameters_data):
             _desc = _stats.generate_description()
 
             # Create histogram for this parameter
-            _fig = create_parameter_histogram(_param_data.display_name, _param_data.values, _stats, go)
+            _fig = create_parameter_histogram(_param_data.display_name, _param_data.valid_values, _stats, go)
 
             # Combine description and histogram in a chapter
             _param_chapters.append(
@@ -614,42 +828,79 @@ def _(mo):
 
 
 @app.cell
-def _(np, parameters_data, pd, stats):
-    # Perform normality tests using parameter data
-    _normality_results = []
-
-    for _param_data in parameters_data:
-        # Get non-NaN values from parameter data
-        _data = _param_data.values[~np.isnan(_param_data.values)]
+def _(dataclass, np, special, stats):
+    @dataclass
+    class NormalityResults:
+        """Normality test results of every parameter, one array per statistic."""
+
+        shapiro_w: np.ndarray
+        shapiro_p: np.ndarray
+        ad_stat: np.ndarray
+        ad_critical_5pct: np.ndarray
+        ks_stat: np.ndarray
+        ks_p: np.ndarray
+
+        def to_frame(self, names, pd):
+            """The normality table, one row per parameter; statistics rounded to 4 decimals."""
+            passed = np.array(["❌ No", "✅ Yes"])
+            return pd.DataFrame(
+                {
+                    "Parameter": names,
+                    "Shapiro-W": self.shapiro_w.round(4),
+                    "Shapiro p": self.shapiro_p.round(4),
+                    "Shapiro?": passed[(self.shapiro_p > 0.05).astype(int)],
+                    "A-D Stat": self.ad_stat.round(4),
+                    "A-D Crit(5%)": self.ad_critical_5pct.round(4),
+                    "A-D?": passed[(self.ad_stat < self.ad_critical_5pct).astype(int)],
+                    "K-S Stat": self.ks_stat.round(4),
+                    "K-S p": self.ks_p.round(4),
+                    "K-S?": passed[(self.ks_p > 0.05).astype(int)],
+                }
+            )
 
-        # Shapiro-Wilk test (best for small samples, n < 50)
-        _shapiro_stat, _shapiro_p = stats.shapiro(_data)
+    def normality_tests(store, column_stats) -> NormalityResults:
+        """
+        Shapiro-Wilk, Anderson-Darling and Kolmogorov-Smirnov tests of every parameter in `store`, ignoring NaNs.
 
-        # Anderson-Darling test (excellent for small samples, more sensitive at tails)
-        _ad_result = stats.anderson(_data, dist="norm")
-        # Get critical value for 5% significance level (index 2 corresponds to 5%)
-        _ad_critical_5pct = _ad_result.critical_values[2]
-        _ad_normal = "✅ Yes" if _ad_result.statistic < _ad_critical_5pct else "❌ No"
+        Same results as stats.shapiro, stats.anderson(dist="norm") and stats.kstest against a normal with the
+        sample mean and (ddof=0) std, per column. A-D and K-S run on all columns at once, from one sort of the
+        matrix and the moments already in `column_stats`. Shapiro-Wilk has no vectorised form, so it calls
+        SciPy's compiled routine per column, on the store's cached non-NaN values.
+        """
+        count, mean = column_stats.count, column_stats.mean
+        ordered = np.sort(store.matrix, axis=0)  # NaNs last: column j's values are its first count[j] rows
+        rank = np.arange(1, len(ordered) + 1)[:, np.newaxis]
+        valid = rank <= count
+        n = np.maximum(count, 1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Anderson-Darling, standardised with the sample std (ddof=1); the i-th smallest pairs with the i-th largest
+            z = (ordered - mean) / column_stats.std
+            # special.log_ndtr is what stats.norm.logcdf/logsf evaluate, without the distribution's per-call overhead
+            logsf_reversed = np.take_along_axis(special.log_ndtr(-z), np.maximum(count - rank, 0), axis=0)
+            terms = (2 * rank - 1.0) / n * (special.log_ndtr(z) + logsf_reversed)
+            ad_stat = -count - np.where(valid, terms, 0.0).sum(axis=0)
+            # The critical values only depend on n, and their small-sample correction differs between SciPy versions
+            critical = {k: stats.anderson(np.arange(k, dtype=float), dist="norm").critical_values[2] for k in np.unique(count[count > 0])}
+            ad_critical_5pct = np.array([critical.get(k, np.nan) for k in count])
+
+            # Kolmogorov-Smirnov against the normal with the sample mean and population std (ddof=0)
+            cdf = special.ndtr((ordered - mean) / (column_stats.std * np.sqrt((count - 1) / n)))
+            d_plus = np.where(valid, rank / n - cdf, -np.inf).max(axis=0, initial=-np.inf)
+            d_minus = np.where(valid, cdf - (rank - 1) / n, -np.inf).max(axis=0, initial=-np.inf)
+            ks_stat = np.maximum(d_plus, d_minus)
+            ks_p = np.clip(stats.kstwo.sf(ks_stat, count), 0.0, 1.0)
+
+        shapiro = np.array([stats.shapiro(store.valid_values(name)) for name in store.names]).reshape(-1, 2)
+        return NormalityResults(shapiro[:, 0], shapiro[:, 1], ad_stat, ad_critical_5pct, ks_stat, ks_p)
+
+    return (normality_tests,)
 
-        # Kolmogorov-Smirnov test (better for larger samples)
-        _ks_stat, _ks_p = stats.kstest(_data, "norm", args=(_data.mean(), _data.std()))
 
-        _normality_results.append(
-            {
-                "Parameter": _param_data.name,
-                "Shapiro-W": round(_shapiro_stat, 4),
-                "Shapiro p": round(_shapiro_p, 4),
-                "Shapiro?": "✅ Yes" if _shapiro_p > 0.05 else "❌ No",
-                "A-D Stat": round(_ad_result.statistic, 4),
-                "A-D Crit(5%)": round(_ad_critical_5pct, 4),
-                "A-D?": _ad_normal,
-                "K-S Stat": round(_ks_stat, 4),
-                "K-S p": round(_ks_p, 4),
-                "K-S?": "✅ Yes" if _ks_p > 0.05 else "❌ No",
-            }
-        )
-
-    normality_df = pd.DataFrame(_normality_results)
+@app.cell
+def _(column_stats, normality_tests, parameter_store, pd):
+    # Perform the normality tests for all parameters at once
+    normality_df = normality_tests(parameter_store, column_stats).to_frame(parameter_store.names, pd)
     # Show the normality test results table
     normality_df  # noqa: B018
     return (normality_df,)
@@ -715,8 +966,7 @@ def _(go, np, parameters_data, stats):
         _col = _idx % _n_cols + 1
 
         # Get non-NaN values and sort them
-        _qq_data = _param_data.values[~np.isnan(_param_data.values)]
-        _qq_data = np.sort(_qq_data)
+        _qq_data = np.sort(_param_data.valid_values)
         _theoretical_q = stats.norm.ppf(np.linspace(0.01, 0.99, len(_qq_data)))
 
         # Scatter plot of quantiles
@@ -898,7 +1148,7 @@ def _(np, parameters_data, pd, stats):
 
     for _param_data in parameters_data:
         # Get non-NaN values
-        _data = _param_data.values[~np.isnan(_param_data.values)]
+        _data = _param_data.valid_values
 
         # Calculate basic statistics
         _mean = np.mean(_data)
@@ -1051,42 +1301,47 @@ def _(mo):
 
 
 @app.cell
-def _(mo, np, parameters_data, pd, sample_names):
-    # Create normalization function
-    def normalize_parameter(values, lower_is_better=False):
+def _(np):
+    def normalize_matrix(matrix, lower_is_better):
         """
-        Normalize parameter values to [0, 1] range.
+        Normalize every column of `matrix` to the [0, 1] range.
 
         Arguments:
-            values: numpy array of values
-            lower_is_better: If True, invert normalized values (1 - normalized)
+            matrix: samples x parameters array of values; NaNs are ignored for the min/max and stay NaN
+            lower_is_better: one bool per column; those columns are inverted (1 - normalized)
 
         Returns:
-            Normalized values where 1.0 = best, 0.0 = worst
+            Normalized values where 1.0 = best, 0.0 = worst; a column with a single distinct value is all 1.0
 
         """
-        # Remove NaN values for min/max calculation
-        valid_vals = values[~np.isnan(values)]
-
-        if len(valid_vals) == 0:
-            return values  # Return as-is if no valid data
-
-        min_val = np.min(valid_vals)
-        max_val = np.max(valid_vals)
-
+        # NaN-ignoring min/max (what np.nanmin/nanmax use); a column without values gets min=inf, max=-inf and stays NaN
+        min_val = np.fmin.reduce(matrix, axis=0, initial=np.inf)
+        max_val = np.fmax.reduce(matrix, axis=0, initial=-np.inf)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Min-max normalization, in place in one new array
+            normalized = np.subtract(matrix, min_val)
+            normalized /= max_val - min_val
+        # Invert if lower is better
+        np.subtract(1.0, normalized, out=normalized, where=np.asarray(lower_is_better, dtype=bool))
         # Avoid division by zero
-        if max_val == min_val:
-            return np.ones_like(values)
+        normalized[:, max_val == min_val] = 1.0
+        return normalized
 
-        # Min-max normalization
-        normalized = (values - min_val) / (max_val - min_val)
+    def rank_samples(normalized, weights=None):
+        """
+        Performance scores (weighted sums of each row) and the row order from best to worst score.
 
-        # Invert if lower is better
-        if lower_is_better:
-            normalized = 1.0 - normalized
+        Equal weights by default. A sample with a NaN value gets a NaN score and is ranked last.
+        """
+        weights = np.ones(normalized.shape[1]) if weights is None else np.asarray(weights, dtype=float)
+        scores = normalized @ weights
+        return scores, np.argsort(-scores, kind="stable")
 
-        return normalized
+    return normalize_matrix, rank_samples
 
+
+@app.cell
+def _(mo, normalize_matrix, np, parameter_store, pd, sample_names):
     # Define which parameters should be inverted (lower is better)
     param_directions = {
         "Residue": True,  # Lower residue = better combustion efficiency
@@ -1094,23 +1349,14 @@ def _(mo, np, parameters_data, pd, sample_names):
         "HRC": False,  # Higher HRC = more intense combustion
         "Time1": True,  # Lower time = faster ignition
     }
+    _param_names = parameter_store.names
 
-    # Create normalized data dictionary
-    _norm_data = {"Sample": sample_names}
+    # Normalize all parameters at once, with one direction flag per parameter column
+    normalized_values = normalize_matrix(parameter_store.matrix, np.array([param_directions.get(name, False) for name in _param_names], dtype=bool))
 
     # Store original and normalized values
-    _original_data = {"Sample": sample_names}
-
-    for _param_data in parameters_data:
-        _param_name = _param_data.name
-        _lower_is_better = param_directions.get(_param_name, False)
-
-        # Store original values
-        _original_data[_param_name] = _param_data.values
-
-        # Normalize
-        _normalized = normalize_parameter(_param_data.values, lower_is_better=_lower_is_better)
-        _norm_data[f"{_param_name}_norm"] = _normalized
+    _original_data = {"Sample": sample_names, **dict(zip(_param_names, parameter_store.matrix.T, strict=True))}
+    _norm_data = {"Sample": sample_names, **{f"{name}_norm": column for name, column in zip(_param_names, normalized_values.T, strict=True)}}
 
     # Create DataFrames
     original_df = pd.DataFrame(_original_data)
@@ -1118,8 +1364,7 @@ def _(mo, np, parameters_data, pd, sample_names):
 
     # Combine original and normalized for display - interleave columns
     combined_df = pd.DataFrame({"Sample": sample_names})
-    for _param_data in parameters_data:
-        _param_name = _param_data.name
+    for _param_name in _param_names:
         # Add original value first, then normalized value next to it
         combined_df[_param_name] = original_df[_param_name]
         combined_df[f"{_param_name}_norm"] = normalized_df[f"{_param_name}_norm"]
@@ -1134,7 +1379,7 @@ def _(mo, np, parameters_data, pd, sample_names):
         show_column_summaries=False,
     )
     _display_table  # noqa: B018
-    return combined_df, normalize_parameter, normalized_df, original_df, param_directions
+    return combined_df, normalized_df, normalized_values, original_df, param_directions
 
 
 @app.cell
@@ -1210,7 +1455,7 @@ def _(mo):
 
 
 @app.cell
-def _(go, normalized_df, parameters_data, sample_names):
+def _(go, normalized_values, parameters_data, sample_names):
     # Create radar chart for all samples
     fig_radar = go.Figure()
 
@@ -1220,7 +1465,7 @@ def _(go, normalized_df, parameters_data, sample_names):
     # Add a trace for each sample
     for _sample_idx, _sample in enumerate(sample_names):
         # Get normalized values for this sample
-        _values = [normalized_df[f"{param}_norm"].iloc[_sample_idx] for param in _param_names]
+        _values = normalized_values[_sample_idx].tolist()
 
         # Close the radar chart by repeating the first value
         _radar_values = [*_values, _values[0]]
@@ -1316,30 +1561,13 @@ def _(mo):
 
 
 @app.cell
-def _(mo, normalized_df, parameters_data, pd, sample_names):
-    # Calculate performance scores
-    _param_names = [p.name for p in parameters_data]
-
-    # Sum normalized values for each sample
-    _scores = []
-    for _sample_idx in range(len(sample_names)):
-        _score = sum(normalized_df[f"{param}_norm"].iloc[_sample_idx] for param in _param_names)
-        _scores.append(_score)
-
-    # Create performance ranking DataFrame
-    performance_df = pd.DataFrame(
-        {
-            "Sample": sample_names,
-            "Performance Score": _scores,
-        }
-    )
-
-    # Add individual normalized values for reference
-    for _param in _param_names:
-        performance_df[f"{_param}_norm"] = normalized_df[f"{_param}_norm"].values
+def _(mo, normalized_df, normalized_values, pd, rank_samples):
+    # Sum normalized values for each sample, and order the samples by score (descending)
+    _scores, _order = rank_samples(normalized_values)
 
-    # Sort by performance score (descending)
-    performance_df = performance_df.sort_values("Performance Score", ascending=False).reset_index(drop=True)
+    # Create performance ranking DataFrame, with the individual normalized values for reference
+    performance_df = normalized_df.iloc[_order].reset_index(drop=True)
+    performance_df.insert(1, "Performance Score", _scores[_order])
 
     # Add rank column
     performance_df.insert(0, "Rank", range(1, len(performance_df) + 1))
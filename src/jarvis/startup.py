@@ -0,0 +1,58 @@
+"""Profile the import cost of the jarvis CLI with ``python -X importtime``."""
+
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse the ``-X importtime`` report; the header and unrelated stderr lines are ignored."""
+    timings = []
+    for line in stderr.splitlines():
+        m = _IMPORTTIME_LINE.match(line)
+        if m:
+            # The module column is indented two spaces per nesting level, after one separating space.
+            depth = (len(m.group(3)) - 1) // 2
+            timings.append(ImportTiming(m.group(4), int(m.group(1)), int(m.group(2)), depth))
+    return timings
+
+
+def profile_startup(module: str = "jarvis.main") -> list[ImportTiming]:
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=False)  # noqa: S603
+    return parse_importtime(proc.stderr)
+
+
+def time_version_command(runs: int = 5) -> float:
+    """Best wall time, in seconds, of ``jarvis --version`` in a fresh interpreter."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "jarvis.main", "--version"], capture_output=True, check=False)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def startup_report(top: int = 15) -> str:
+    timings = profile_startup()
+    total_us = sum(t.self_us for t in timings)
+    lines = [
+        f"jarvis --version: {time_version_command() * 1000:.0f} ms (target: < 100 ms)",
+        f"import jarvis.main: {total_us / 1000:.1f} ms across {len(timings)} modules",
+        "",
+        f"{'self [ms]':>10} {'cumulative [ms]':>16}  module",
+    ]
+    for t in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]:
+        lines.append(f"{t.self_us / 1000:>10.1f} {t.cumulative_us / 1000:>16.1f}  {t.module}")
+    return "\n".join(lines)
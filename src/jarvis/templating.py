@@ -0,0 +1,39 @@
+"""Process-wide Jinja2 environment shared by the page writers."""
+
+from functools import cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from jarvis._md import DEFAULT_EXTENSIONS, get_renderer
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+def get_environment(templates_root: Path = TEMPLATES_DIR, cache_dir: Path | None = None, markdown_extensions: tuple[str, ...] = DEFAULT_EXTENSIONS) -> Environment:
+    """
+    Return the environment for ``templates_root``, created once per process.
+
+    Templates are addressed relative to the root (``landing/index.html.j2``), so every writer shares one
+    environment and its compiled-template cache. With ``cache_dir``, compiled templates also persist on disk
+    in a ``FileSystemBytecodeCache`` and are only recompiled when their source changes. The ``md`` filter renders
+    inline markdown with the shared renderer for ``markdown_extensions``.
+    """
+    # The cache keys on how the arguments are passed, so omitted, positional and keyword ones are normalised first.
+    return _create_environment(Path(templates_root), cache_dir, tuple(markdown_extensions))
+
+
+@cache
+def _create_environment(templates_root: Path, cache_dir: Path | None, markdown_extensions: tuple[str, ...]) -> Environment:
+    bytecode_cache = None
+    if cache_dir is not None:
+        bytecode_dir = cache_dir / "jinja2"
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_dir))
+    env = Environment(
+        loader=FileSystemLoader(str(templates_root)),
+        autoescape=select_autoescape(["html"]),
+        bytecode_cache=bytecode_cache,
+    )
+    env.filters["md"] = get_renderer(markdown_extensions).render_inline
+    return env
@@ -0,0 +1,137 @@
+"""Regenerate pages in-process whenever their inputs change (``jarvis watch``)."""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from py_app_dev.core.logging import logger, time_it
+
+from jarvis.build import PageWriter
+from jarvis.deps import template_files
+
+Snapshot = dict[str, tuple[int, int]]
+
+
+def snapshot(paths: list[Path]) -> Snapshot:
+    """Size and mtime of every existing path; appearing and vanishing files change the snapshot too."""
+    result: Snapshot = {}
+    for path in paths:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        result[str(path)] = (st.st_size, st.st_mtime_ns)
+    return result
+
+
+def _mtimes(paths: list[Path]) -> dict[Path, int] | None:
+    try:
+        return {path: path.stat().st_mtime_ns for path in paths}
+    except FileNotFoundError:
+        return None
+
+
+class InputTracker:
+    """
+    The inputs of one writer, expanded once and kept between polls.
+
+    A source directory is walked again only when the mtime of one of its directories changes, i.e. when an entry
+    is added, removed or renamed; edits to existing files show up in the snapshot without a walk. The template
+    dependencies are resolved again only when one of the templates changes. Writers that don't report their
+    ``sources()`` and templates are asked for all their ``inputs()`` on every poll.
+    """
+
+    def __init__(self, writer: PageWriter) -> None:
+        self.writer = writer
+        self._trees: dict[Path, tuple[dict[Path, int], list[Path]]] = {}  # source dir -> (dir mtimes, files)
+        self._templates: list[Path] = []
+        self._templates_snapshot: Snapshot | None = None
+
+    def inputs(self) -> list[Path]:
+        sources = getattr(self.writer, "sources", None)
+        if sources is None:
+            return self.writer.inputs()
+        return [*(f for source in sources() for f in self._expand(source)), *self._template_files()]
+
+    def _expand(self, source: Path) -> list[Path]:
+        cached = self._trees.get(source)
+        if cached is not None and _mtimes(list(cached[0])) == cached[0]:
+            return cached[1]
+        if not source.is_dir():
+            self._trees.pop(source, None)
+            return [source]
+        entries = sorted(source.rglob("*"))
+        dirs = _mtimes([source, *(p for p in entries if p.is_dir())])
+        files = [p for p in entries if p.is_file()]
+        if dirs is not None:
+            self._trees[source] = (dirs, files)
+        return files
+
+    def _template_files(self) -> list[Path]:
+        if self._templates_snapshot is None or snapshot(self._templates) != self._templates_snapshot:
+            writer = self.writer
+            self._templates = template_files(writer.env, writer.template_name)  # type: ignore[attr-defined]
+            self._templates_snapshot = snapshot(self._templates)
+        return self._templates
+
+
+class Watcher:
+    """
+    Poll the inputs of each writer and re-run only the writers whose inputs changed.
+
+    Changes are debounced: a writer runs once its inputs have been quiet for ``debounce`` seconds, so an
+    editor's save burst (write, rename, touch) triggers one render instead of several.
+    """
+
+    def __init__(
+        self,
+        writers: dict[str, PageWriter],
+        poll_interval: float = 0.1,
+        debounce: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.writers = writers
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.clock = clock
+        self._inputs = {name: InputTracker(writer) for name, writer in writers.items()}
+        self._snapshots = {name: snapshot(tracker.inputs()) for name, tracker in self._inputs.items()}
+        self._pending: set[str] = set()
+        self._last_change = 0.0
+
+    def poll(self) -> set[str]:
+        """Record which writers have changed inputs since the last poll; returns them."""
+        changed = set()
+        for name, tracker in self._inputs.items():
+            current = snapshot(tracker.inputs())
+            if current != self._snapshots[name]:
+                self._snapshots[name] = current
+                changed.add(name)
+        if changed:
+            self._pending |= changed
+            self._last_change = self.clock()
+        return changed
+
+    def flush(self) -> list[str]:
+        """Run the pending writers once the debounce window has passed; returns the names that ran."""
+        if not self._pending or self.clock() - self._last_change < self.debounce:
+            return []
+        ran = sorted(self._pending)
+        self._pending.clear()
+        for name in ran:
+            try:
+                time_it(name)(self.writers[name].write)()
+            except Exception as e:
+                # Half-saved inputs (e.g. invalid JSON) are normal while editing; report and keep watching.
+                logger.error(f"{name} failed: {e}")
+        return ran
+
+    def run(self) -> None:
+        logger.info(f"Watching inputs of {', '.join(self.writers)} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(self.poll_interval)
+                self.poll()
+                self.flush()
+        except KeyboardInterrupt:
+            logger.info("Stopped watching")
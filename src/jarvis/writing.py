@@ -1,6 +1,9 @@
 """Scan blog post frontmatter to surface recent writing on the landing page."""
 
-from dataclasses import dataclass
+import heapq
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 
@@ -11,53 +14,213 @@ class WritingEntry:
     date: date
     category: str
     url: str  # relative to the landing (e.g. blogs/2026/smarty_p2.html)
+    tags: list[str] = field(default_factory=list)
 
     @property
     def date_label(self) -> str:
         return self.date.isoformat()
 
 
-def _parse_frontmatter(text: str) -> dict[str, str]:
-    lines = text.splitlines()
-    if not lines or lines[0].strip() != "---":
+# Frontmatter is a handful of short lines; anything past this is a malformed block, not metadata.
+MAX_FRONTMATTER_CHARS = 64 * 1024
+
+FrontmatterValue = str | list[str]
+Frontmatter = dict[str, FrontmatterValue]
+
+# Keys whose value is a list; every other value is kept as the plain string, brackets included (``title: [Draft]``).
+LIST_KEYS = frozenset({"tags"})
+
+
+def _parse_value(key: str, raw: str) -> FrontmatterValue:
+    """``[a, b]`` flow sequences of the ``LIST_KEYS`` become lists; anything else stays a plain string."""
+    if key in LIST_KEYS and raw.startswith("[") and raw.endswith("]"):
+        return [item.strip().strip("'\"") for item in raw[1:-1].split(",") if item.strip()]
+    return raw
+
+
+def _parse_frontmatter_lines(lines: Iterable[str]) -> Frontmatter:
+    """
+    Parse a leading ``---`` block of ``key: value`` lines; consumes ``lines`` only up to the closing ``---``.
+
+    Supports YAML-style lists for the ``LIST_KEYS``, either ``key: [a, b]`` or ``key:`` followed by ``- item`` lines.
+    Returns an empty dict if there is no block or it grows past ``MAX_FRONTMATTER_CHARS``.
+    """
+    it = iter(lines)
+    first = next(it, None)
+    if first is None or first.strip() != "---":
         return {}
-    fm: dict[str, str] = {}
-    for line in lines[1:]:
-        if line.strip() == "---":
+    fm: Frontmatter = {}
+    key: str | None = None
+    size = len(first)
+    for line in it:
+        size += len(line)
+        if size > MAX_FRONTMATTER_CHARS:
+            return {}
+        stripped = line.strip()
+        if stripped == "---":
             break
-        if ":" in line:
+        if stripped.startswith("- ") and key in LIST_KEYS:
+            items = fm[key]
+            if not isinstance(items, list):
+                items = fm[key] = [items] if items else []
+            items.append(stripped[2:].strip())
+        elif ":" in line:
             k, _, v = line.partition(":")
-            fm[k.strip()] = v.strip()
+            key = k.strip()
+            fm[key] = _parse_value(key, v.strip())
     return fm
 
 
-def scan_blogs(blogs_dir: Path, limit: int = 4) -> list[WritingEntry]:
+def _iter_lines(text: str) -> Iterator[str]:
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        yield text[start:end]
+        start = end + 1
+
+
+def _parse_frontmatter(text: str) -> Frontmatter:
+    return _parse_frontmatter_lines(_iter_lines(text))
+
+
+def _read_frontmatter(path: Path) -> Frontmatter:
+    """Read only the frontmatter block of ``path``; the body, and any oversized line, is never loaded."""
+    with path.open() as f:
+        return _parse_frontmatter_lines(iter(lambda: f.readline(MAX_FRONTMATTER_CHARS + 1), ""))
+
+
+def _as_list(value: FrontmatterValue | None) -> list[str]:
+    """Tags are written as ``a, b`` by ``jarvis blog``, or as a YAML list."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [tag.strip() for tag in value.split(",") if tag.strip()]
+
+
+class FrontmatterIndex:
     """
-    Return the most recent ``limit`` blog posts, newest first.
+    Persistent cache of parsed frontmatter keyed by post path, validated by mtime + size.
+
+    Unchanged posts are served from the index without being opened.
+    """
+
+    # Bump whenever the parser's output changes, so entries parsed by an older version are discarded.
+    VERSION = 3
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, tuple[int, int, Frontmatter]] = {}
+        self._dirty = False
+        if path.exists():
+            try:
+                data = json.loads(path.read_text())
+                if data.get("version") == self.VERSION:
+                    self._entries = {k: (v[0], v[1], v[2]) for k, v in data["posts"].items()}
+            except (ValueError, TypeError, IndexError, KeyError, AttributeError):
+                self._entries = {}
+
+    def get(self, md_path: Path) -> Frontmatter:
+        st = md_path.stat()
+        key = str(md_path)
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        fm = _read_frontmatter(md_path)
+        self._entries[key] = (st.st_mtime_ns, st.st_size, fm)
+        self._dirty = True
+        return fm
+
+    def prune(self, keep: set[str]) -> None:
+        """Forget posts that no longer exist."""
+        stale = self._entries.keys() - keep
+        for key in stale:
+            del self._entries[key]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({"version": self.VERSION, "posts": {k: list(v) for k, v in self._entries.items()}}))
+        self._dirty = False
+
+
+def _scan_posts(blogs_dir: Path, index: FrontmatterIndex | None) -> Iterator[tuple[date, Path, Frontmatter]]:
+    """
+    Yield ``(date, path, frontmatter)`` for every valid post, in filesystem order.
 
     Skips files whose frontmatter is missing the required ``date``, ``title``, or ``category`` keys.
+    With ``index``, frontmatter of unchanged posts comes from the index, which is saved once the scan completes.
     """
-    entries: list[WritingEntry] = []
+    seen: set[str] = set()
     for md_path in blogs_dir.rglob("*.md"):
         # Skip stray `.md.md` files and any non-post files at the blog index level.
         if md_path.name.endswith(".md.md"):
             continue
-        fm = _parse_frontmatter(md_path.read_text())
-        if not all(k in fm for k in ("date", "title", "category")):
+        if index is None:
+            fm = _read_frontmatter(md_path)
+        else:
+            seen.add(str(md_path))
+            fm = index.get(md_path)
+        if not all(isinstance(fm.get(k), str) for k in ("date", "title", "category")):
             continue
         try:
-            post_date = date.fromisoformat(fm["date"])
+            post_date = date.fromisoformat(str(fm["date"]))
         except ValueError:
             continue
-        # blogs_dir is docs/blogs; relative URL on the landing is "blogs/<year>/<slug>.html".
-        rel = md_path.relative_to(blogs_dir.parent).with_suffix(".html")
-        entries.append(
-            WritingEntry(
-                title=fm["title"],
-                date=post_date,
-                category=fm["category"],
-                url=rel.as_posix(),
-            )
-        )
-    entries.sort(key=lambda e: e.date, reverse=True)
-    return entries[:limit]
+        yield post_date, md_path, fm
+    if index is not None:
+        index.prune(seen)
+        index.save()
+
+
+def _to_entry(blogs_dir: Path, md_path: Path, post_date: date, fm: Frontmatter) -> WritingEntry:
+    # blogs_dir is docs/blogs; relative URL on the landing is "blogs/<year>/<slug>.html".
+    rel = md_path.relative_to(blogs_dir.parent).with_suffix(".html")
+    return WritingEntry(
+        title=str(fm["title"]),
+        date=post_date,
+        category=str(fm["category"]),
+        url=rel.as_posix(),
+        tags=_as_list(fm.get("tags")),
+    )
+
+
+def scan_blogs(blogs_dir: Path, limit: int = 4, index: FrontmatterIndex | None = None) -> list[WritingEntry]:
+    """
+    Return the most recent ``limit`` blog posts, newest first.
+
+    Keeps a bounded min-heap of the newest ``limit`` posts while scanning, so only those become entries.
+    Posts with the same date keep their scan order.
+    """
+    if limit <= 0:
+        for _ in _scan_posts(blogs_dir, index):
+            pass
+        return []
+    # Heap root is the oldest kept post; among equal dates the later-scanned one is evicted first.
+    heap: list[tuple[int, int, Path, Frontmatter]] = []
+    for seq, (post_date, md_path, fm) in enumerate(_scan_posts(blogs_dir, index)):
+        item = (post_date.toordinal(), -seq, md_path, fm)
+        if len(heap) < limit:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+    heap.sort(key=lambda item: item[:2], reverse=True)
+    return [_to_entry(blogs_dir, md_path, date.fromordinal(ordinal), fm) for ordinal, _, md_path, fm in heap]
+
+
+def iter_blogs(blogs_dir: Path, index: FrontmatterIndex | None = None) -> Iterator[WritingEntry]:
+    """
+    Yield every blog post, newest first.
+
+    Only the sort keys are heapified up front; each ``WritingEntry`` is built when it is consumed, so
+    callers that stop early pay O(n + k log n) instead of materialising and sorting every entry.
+    """
+    heap = [(-post_date.toordinal(), seq, md_path, fm) for seq, (post_date, md_path, fm) in enumerate(_scan_posts(blogs_dir, index))]
+    heapq.heapify(heap)
+    while heap:
+        neg_ordinal, _, md_path, fm = heapq.heappop(heap)
+        yield _to_entry(blogs_dir, md_path, date.fromordinal(-neg_ordinal), fm)
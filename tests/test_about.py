@@ -1,4 +1,9 @@
-from jarvis.about import parse_about_md
+import json
+from pathlib import Path
+
+from jarvis.about import AboutWriter, parse_about_md
+from jarvis.assets import ASSETS_URL, MANIFEST_NAME
+from jarvis.landing import LandingWriter
 
 
 def test_extracts_h1_title() -> None:
@@ -18,3 +23,29 @@ def test_stops_at_first_h2() -> None:
     assert "Kept." in body
     assert "Dropped." not in body
     assert "rough timeline" not in body
+
+
+def test_writer_links_the_assets_the_landing_page_published(tmp_path: Path) -> None:
+    (tmp_path / "about.md").write_text("# About me\n\nHi.\n")
+    (tmp_path / "timeline.json").write_text('{"entries": []}')
+    out = tmp_path / "out"
+    (out / ASSETS_URL).mkdir(parents=True)
+    (out / ASSETS_URL / MANIFEST_NAME).write_text(json.dumps({"landing.css": f"{ASSETS_URL}/landing.0123456789.css"}))
+
+    AboutWriter(tmp_path / "about.md", tmp_path / "timeline.json", out, minify=True).write()
+
+    assert f'href="{ASSETS_URL}/landing.0123456789.css"' in (out / "about.html").read_text()
+
+
+def test_writer_links_the_assets_of_a_custom_landing_templates_dir(tmp_path: Path) -> None:
+    (tmp_path / "about.md").write_text("# About me\n\nHi.\n")
+    (tmp_path / "timeline.json").write_text('{"entries": []}')
+    (tmp_path / "landing" / "assets").mkdir(parents=True)
+    (tmp_path / "landing" / "assets" / "landing.css").write_text("a { color: red }\n")
+    landing = LandingWriter(
+        tmp_path / "p.json", tmp_path / "p", tmp_path / "t.json", tmp_path / "n", tmp_path / "b", tmp_path / "out", templates_dir=tmp_path / "landing", minify=True
+    )
+
+    AboutWriter(tmp_path / "about.md", tmp_path / "timeline.json", tmp_path / "out", assets=landing).write()
+
+    assert f'href="{landing.asset_manifest().url("landing.css")}"' in (tmp_path / "out" / "about.html").read_text()
@@ -0,0 +1,43 @@
+import json
+from pathlib import Path
+
+import pytest
+from py_app_dev.core.exceptions import UserNotificationException
+
+from jarvis.assets import MANIFEST_NAME, AssetManifest, fingerprinted_name
+
+
+def test_fingerprinted_name_keeps_directory_and_suffix() -> None:
+    assert fingerprinted_name("fonts/inter.woff2", "0123456789abcdef") == "fonts/inter.0123456789.woff2"
+
+
+def test_manifest_hashes_served_content(tmp_path: Path) -> None:
+    (tmp_path / "landing.css").write_text("a {\n  color: red;\n}\n")
+
+    plain = AssetManifest.from_dir(tmp_path)
+    minified = AssetManifest.from_dir(tmp_path, minify=True)
+
+    assert plain.url("landing.css").startswith("_landing/landing.")
+    assert plain.url("landing.css") != minified.url("landing.css")
+    assert minified.assets["landing.css"].content == b"a{color:red}"
+    assert json.loads(plain.to_json()) == {"landing.css": plain.url("landing.css")}
+
+    (tmp_path / "landing.css").write_text("a { color: blue }\n")
+    assert AssetManifest.from_dir(tmp_path).url("landing.css") != plain.url("landing.css")
+
+
+def test_unknown_asset_is_reported(tmp_path: Path) -> None:
+    (tmp_path / "landing.css").write_text("a {}")
+
+    with pytest.raises(UserNotificationException, match=r"Unknown asset 'missing\.css'"):
+        AssetManifest.from_dir(tmp_path).url("missing.css")
+
+
+def test_loaded_manifest_gives_the_published_urls(tmp_path: Path) -> None:
+    (tmp_path / "landing.css").write_text("a {}")
+    published = AssetManifest.from_dir(tmp_path, minify=True)
+    (tmp_path / MANIFEST_NAME).write_text(published.to_json())
+
+    assert AssetManifest.load(tmp_path / MANIFEST_NAME).url("landing.css") == published.url("landing.css")
+    with pytest.raises(UserNotificationException, match="generate the landing page first"):
+        AssetManifest.load(tmp_path / "missing.json")
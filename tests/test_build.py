@@ -0,0 +1,86 @@
+from pathlib import Path
+
+from jarvis.build import BuildManifest, IncrementalBuilder
+
+
+class FakeWriter:
+    def __init__(self, src: Path, out: Path) -> None:
+        self.src = src
+        self.out = out
+        self.writes = 0
+
+    def inputs(self) -> list[Path]:
+        return [self.src]
+
+    def outputs(self) -> list[Path]:
+        return [self.out]
+
+    def write(self) -> None:
+        self.writes += 1
+        self.out.write_text(self.src.read_text().upper())
+
+
+def _setup(tmp_path: Path) -> tuple[FakeWriter, Path]:
+    src = tmp_path / "in.txt"
+    src.write_text("hello")
+    return FakeWriter(src, tmp_path / "out.txt"), tmp_path / "cache" / "manifest.json"
+
+
+def test_skips_unchanged_writer_across_runs(tmp_path: Path) -> None:
+    writer, manifest_file = _setup(tmp_path)
+    manifest = BuildManifest(manifest_file)
+    assert IncrementalBuilder(manifest).run("page", writer)
+    manifest.save()
+
+    assert not IncrementalBuilder(BuildManifest(manifest_file)).run("page", writer)
+    assert writer.writes == 1
+
+
+def test_rebuilds_when_input_content_changes(tmp_path: Path) -> None:
+    writer, manifest_file = _setup(tmp_path)
+    manifest = BuildManifest(manifest_file)
+    builder = IncrementalBuilder(manifest)
+    builder.run("page", writer)
+
+    writer.src.write_text("changed!")
+
+    assert builder.run("page", writer)
+    assert writer.out.read_text() == "CHANGED!"
+
+
+def test_rebuilds_when_output_is_missing_or_forced(tmp_path: Path) -> None:
+    writer, manifest_file = _setup(tmp_path)
+    manifest = BuildManifest(manifest_file)
+    IncrementalBuilder(manifest).run("page", writer)
+
+    writer.out.unlink()
+    assert IncrementalBuilder(manifest).run("page", writer)
+    assert IncrementalBuilder(manifest, force=True).run("page", writer)
+    assert writer.writes == 3
+
+
+def test_rebuilds_when_settings_change(tmp_path: Path) -> None:
+    writer, manifest_file = _setup(tmp_path)
+    manifest = BuildManifest(manifest_file)
+    IncrementalBuilder(manifest, settings="minify=False").run("page", writer)
+
+    assert IncrementalBuilder(manifest, settings="minify=True").run("page", writer)
+    assert not IncrementalBuilder(manifest, settings="minify=True").run("page", writer)
+
+
+def test_corrupt_manifest_is_ignored(tmp_path: Path) -> None:
+    writer, manifest_file = _setup(tmp_path)
+    manifest_file.parent.mkdir()
+    manifest_file.write_text("{not json")
+
+    assert IncrementalBuilder(BuildManifest(manifest_file)).run("page", writer)
+
+
+def test_run_all_reports_written_writers(tmp_path: Path) -> None:
+    a, manifest_file = _setup(tmp_path)
+    b = FakeWriter(a.src, tmp_path / "other.txt")
+    builder = IncrementalBuilder(BuildManifest(manifest_file))
+
+    assert builder.run_all({"a": a, "b": b}, parallel=True) == ["a", "b"]
+    assert builder.run_all({"a": a, "b": b}, parallel=True) == []
+    assert b.out.read_text() == "HELLO"
@@ -0,0 +1,53 @@
+import gzip
+import json
+import os
+from pathlib import Path
+
+import brotli
+
+from jarvis.compress import precompress
+
+
+def test_precompress_writes_siblings_and_skips_up_to_date(tmp_path: Path) -> None:
+    page = tmp_path / "index.html"
+    page.write_text("<p>hello</p>\n" * 200)
+    (tmp_path / "tiny.css").write_text("a{}")
+    (tmp_path / "photo.png").write_bytes(b"\x89PNG" * 500)
+
+    first = precompress(tmp_path, jobs=1)
+    second = precompress(tmp_path, jobs=1)
+
+    assert gzip.decompress((tmp_path / "index.html.gz").read_bytes()) == page.read_bytes()
+    assert brotli.decompress((tmp_path / "index.html.br").read_bytes()) == page.read_bytes()
+    assert not (tmp_path / "tiny.css.gz").exists()
+    assert not (tmp_path / "photo.png.gz").exists()
+    assert (first.files, second.files, second.skipped) == (2, 0, 1)
+
+
+def test_precompress_refreshes_siblings_older_than_source(tmp_path: Path) -> None:
+    page = tmp_path / "app.js"
+    page.write_text("console.log('v1');\n" * 100)
+    precompress(tmp_path, formats=("gz",), jobs=1)
+    page.write_text("console.log('v2');\n" * 100)
+    st = (tmp_path / "app.js.gz").stat()
+    os.utime(page, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert precompress(tmp_path, formats=("gz",), jobs=1).files == 1
+    assert b"v2" in gzip.decompress((tmp_path / "app.js.gz").read_bytes())
+
+
+def test_precompress_records_incompressible_files_until_they_change(tmp_path: Path) -> None:
+    site, record = tmp_path / "site", tmp_path / "cache" / "compress.json"
+    site.mkdir()
+    noise = site / "noise.txt"
+    noise.write_bytes(os.urandom(4096))
+
+    first = precompress(site, jobs=1, record=record)
+    second = precompress(site, jobs=1, record=record)
+    st = noise.stat()
+    os.utime(noise, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    third = precompress(site, jobs=1, record=record)
+
+    assert not (site / "noise.txt.gz").exists()
+    assert sorted(json.loads(record.read_text())) == ["noise.txt.br", "noise.txt.gz"]
+    assert (first.skipped, second.skipped, third.skipped) == (0, 1, 0)
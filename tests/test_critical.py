@@ -0,0 +1,39 @@
+from jarvis.critical import FOLD_MARKER, UsedSelectors, critical_css, plan_stylesheet
+
+HTML = f'<body><nav class="top"><a id="home" class="brand x">home</a></nav>{FOLD_MARKER}<section class="talks"><p>below</p></section></body>'
+CSS = """
+:root { --accent: red; }
+nav .brand::before { content: "{ not a block }"; animation: blink 1s; }
+.talks p, nav a:hover { color: var(--accent); }
+.talks { padding: 1rem; }
+@media (max-width: 880px) { .top { display: block; } .talks { padding: 0; } }
+@keyframes blink { 50% { opacity: 0; } }
+@keyframes unused { to { opacity: 1; } }
+"""
+
+
+def test_used_selectors_match_tags_classes_and_ids_ignoring_pseudo_classes() -> None:
+    used = UsedSelectors.from_html(HTML.split(FOLD_MARKER)[0])
+
+    assert used.matches("nav > a.brand:not(.open)#home")
+    assert used.matches("*")
+    assert not used.matches("nav .open")
+    assert not used.matches("section")
+
+
+def test_critical_css_keeps_rules_above_the_fold() -> None:
+    assert critical_css(CSS, HTML) == (
+        ":root{--accent:red}"
+        'nav .brand::before{content:"{ not a block }";animation:blink 1s}'
+        "nav a:hover{color:var(--accent)}"
+        "@media (max-width:880px){.top{display:block}}"
+        "@keyframes blink{50%{opacity:0}}"
+    )
+
+
+def test_small_stylesheet_is_inlined_whole() -> None:
+    whole = plan_stylesheet("s.css", CSS, HTML)
+    critical = plan_stylesheet("s.css", CSS, HTML, inline_limit=10)
+
+    assert (whole.link, whole.inline.count("@keyframes")) == ("none", 2)
+    assert (critical.link, critical.inline) == ("deferred", critical_css(CSS, HTML))
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from jinja2 import Environment
+
+from jarvis.deps import DependencyGraph, PageNode, template_files, template_graph
+from jarvis.templating import get_environment
+
+
+def _env(tmp_path: Path) -> Environment:
+    root = tmp_path / "templates"
+    (root / "page").mkdir(parents=True)
+    (root / "base.html.j2").write_text("<body>{% block body %}{% endblock %}{% include 'footer.txt' %}</body>")
+    (root / "footer.txt").write_text("footer")
+    (root / "page" / "index.html.j2").write_text("{% extends 'base.html.j2' %}{% block body %}hi{% endblock %}")
+    return get_environment(root)
+
+
+def test_template_graph_follows_extends_and_includes(tmp_path: Path) -> None:
+    env = _env(tmp_path)
+
+    assert template_graph(env, "page/index.html.j2") == {
+        "page/index.html.j2": ["base.html.j2"],
+        "base.html.j2": ["footer.txt"],
+        "footer.txt": [],
+    }
+    assert [p.name for p in template_files(env, "page/index.html.j2")] == ["base.html.j2", "footer.txt", "index.html.j2"]
+
+
+def test_pages_affected_by_files_and_directories(tmp_path: Path) -> None:
+    blogs = tmp_path / "blogs"
+    graph = DependencyGraph(
+        {
+            "landing": PageNode(outputs=[], sources=[blogs], templates={}, template_files=[tmp_path / "shared.txt"]),
+            "about": PageNode(outputs=[], sources=[tmp_path / "about.md"], templates={}, template_files=[tmp_path / "shared.txt"]),
+        }
+    )
+
+    assert graph.pages_affected([blogs / "2024" / "post.md"]) == {"landing"}
+    assert graph.pages_affected([tmp_path / "about.md"]) == {"about"}
+    assert graph.pages_affected([tmp_path / "shared.txt"]) == {"landing", "about"}
+    assert graph.pages_affected([tmp_path / "unrelated.json"]) == set()
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from PIL import Image
+
+from jarvis.images import ImagePipeline, variant_widths
+
+
+def test_variant_widths_never_upscale() -> None:
+    assert variant_widths(2000) == [320, 640, 960]
+    assert variant_widths(725) == [320, 640, 725]
+    assert variant_widths(100) == [100]
+
+
+def test_pipeline_renders_variants_once_per_source_content(tmp_path: Path) -> None:
+    source = tmp_path / "logo.png"
+    Image.new("RGBA", (700, 350), (200, 30, 30, 255)).save(source)
+    pipeline = ImagePipeline(tmp_path / "out", jobs=1)
+
+    image = pipeline.run([source])[source]
+    assert pipeline.stats.rendered == 1
+    pipeline.run([source])
+    assert pipeline.stats.rendered == 0
+
+    assert [(v.width, v.height, v.format) for v in image.variants] == [
+        (320, 160, "webp"),
+        (320, 160, "png"),
+        (640, 320, "webp"),
+        (640, 320, "png"),
+        (700, 350, "webp"),
+        (700, 350, "png"),
+    ]
+    with Image.open(tmp_path / "out" / image.variants[0].name) as variant:
+        assert (variant.format, variant.size) == ("WEBP", (320, 160))
+    assert image.src == f"_landing/images/{image.fallback.name}"
+    assert image.srcset("png").endswith(f"{image.fallback.name} 700w")
+
+    Image.new("RGBA", (700, 350), (30, 30, 200, 255)).save(source)
+    assert pipeline.run([source])[source].variants[0].name != image.variants[0].name
+    assert pipeline.stats.rendered == 1
+
+
+def test_pipeline_prunes_variants_of_unused_images_and_uses_the_given_digest(tmp_path: Path) -> None:
+    logo, photo = tmp_path / "logo.png", tmp_path / "photo.png"
+    Image.new("RGB", (200, 100), (200, 30, 30)).save(logo)
+    Image.new("RGB", (200, 100), (30, 30, 200)).save(photo)
+    hashed: list[Path] = []
+
+    def digest(path: Path) -> str:
+        hashed.append(path)
+        return "0123456789abcdef" + path.stem
+
+    pipeline = ImagePipeline(tmp_path / "out", jobs=1, digest=digest)
+    pipeline.run([logo, photo])
+    kept = pipeline.run([logo])[logo]
+
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == sorted(v.name for v in kept.variants)
+    assert pipeline.stats.pruned == 2
+    assert kept.src == "_landing/images/logo.0123456789.200.png"
+    assert hashed == [logo, photo, logo]
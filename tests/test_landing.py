@@ -0,0 +1,76 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from jarvis.assets import ASSETS_URL, MANIFEST_NAME
+from jarvis.images import IMAGES_URL
+from jarvis.landing import LandingWriter
+
+TEMPLATES_DIR = Path(__file__).parents[1] / "src" / "jarvis" / "templates"
+
+
+def _make_docs(tmp_path: Path) -> Path:
+    docs = tmp_path / "docs"
+    (docs / "images").mkdir(parents=True)
+    Image.new("RGB", (700, 350), (200, 30, 30)).save(docs / "images" / "card.png")
+    (docs / "presentations.json").write_text(
+        json.dumps({"talks": [{"title": "Talk", "description": "About it", "link": "talk/index.html", "image": "images/card.png"}], "demos": []})
+    )
+    (docs / "teaching.json").write_text(json.dumps({"notebooks": []}))
+    (docs / "presentations" / "talk").mkdir(parents=True)
+    (docs / "presentations" / "talk" / "index.html").write_text("<html>talk</html>")
+    (docs / "blogs" / "2024").mkdir(parents=True)
+    (docs / "blogs" / "2024" / "post.md").write_text("---\ntitle: A post\ndate: 2024-05-01\ncategory: learning\ntags: [python]\n---\nBody\n")
+    # A custom templates directory, with a stylesheet small enough to check its minified content.
+    shutil.copytree(TEMPLATES_DIR, tmp_path / "templates")
+    (tmp_path / "templates" / "landing" / "assets" / "landing.css").write_text("body {\n  color: red;\n}\n")
+    return docs
+
+
+@pytest.mark.parametrize("use_cache_dir", [True, False])
+def test_write_publishes_page_images_and_assets_without_touching_foreign_files(tmp_path: Path, use_cache_dir: bool) -> None:
+    docs = _make_docs(tmp_path)
+    out = tmp_path / "out"
+    # Written by Sphinx (blog images, pages) or left from an older fingerprint in jarvis's own directory.
+    foreign = [out / "_images" / "esp32-h2-devkitm.jpeg", out / "blogs" / "2024" / "post.html"]
+    for path in foreign:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"sphinx")
+    stale = out / ASSETS_URL / "landing.0000000000.css"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("old")
+    writer = LandingWriter(
+        docs / "presentations.json",
+        docs / "presentations",
+        docs / "teaching.json",
+        docs / "notebooks",
+        docs / "blogs",
+        out,
+        templates_dir=tmp_path / "templates" / "landing",
+        cache_dir=tmp_path / "cache" if use_cache_dir else None,
+        minify=True,
+        critical_css=True,
+    )
+
+    writer.write()
+
+    html = (out / "index.html").read_text()
+    manifest = json.loads((out / ASSETS_URL / MANIFEST_NAME).read_text())
+    css_url = manifest["landing.css"]
+    assert css_url.startswith(f"{ASSETS_URL}/landing.") and css_url.endswith(".css")
+    assert (out / css_url).read_text() == "body{color:red}"
+    # Small enough to be inlined whole by --critical-css, so the page needs no link to the file.
+    assert "<style>body{color:red}</style>" in html
+    assert "<picture>" in html
+    assert f'srcset="{IMAGES_URL}/card.' in html
+    variants = sorted(p.name for p in (out / IMAGES_URL).iterdir())
+    assert len(variants) == 6
+    assert all(f"{IMAGES_URL}/{name}" in html for name in variants)
+    assert "A post" in html
+    assert (out / "talk" / "index.html").read_text() == "<html>talk</html>"
+    assert all(path.read_bytes() == b"sphinx" for path in foreign)
+    assert not stale.exists()
+    assert set(writer.outputs()) >= {out / "index.html", out / css_url, out / ASSETS_URL / MANIFEST_NAME, *(out / IMAGES_URL / n for n in variants)}
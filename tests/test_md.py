@@ -0,0 +1,32 @@
+from jarvis._md import MarkdownRenderer, get_renderer, render_md_inline
+
+
+def test_render_md_inline_strips_single_paragraph() -> None:
+    assert render_md_inline("Joined **Acme**") == "Joined <strong>Acme</strong>"
+
+
+def test_render_inline_is_memoised() -> None:
+    renderer = MarkdownRenderer()
+    renderer.render_inline("[link](https://example.com)")
+    renderer.render_inline("[link](https://example.com)")
+
+    info = renderer.render_inline.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_renderer_applies_configured_extensions() -> None:
+    text = "| a |\n|---|\n| 1 |\n"
+
+    assert "<table>" not in MarkdownRenderer().render(text)
+    assert "<table>" in get_renderer(("tables",)).render(text)
+    assert get_renderer(("tables",)) is get_renderer(("tables",))
+
+
+def test_renderer_reuses_pooled_instances() -> None:
+    renderer = MarkdownRenderer(pool_size=1)
+    renderer.render("# one")
+    with renderer._instance() as instance:
+        pass
+    with renderer._instance() as again:
+        assert again is instance
+        assert renderer.render("# two") == "<h1>two</h1>"
@@ -0,0 +1,47 @@
+import os
+from pathlib import Path
+
+from jarvis.minify import minify_css, minify_html, write_minified
+
+
+def test_minify_css_strips_comments_and_whitespace_but_not_strings() -> None:
+    css = '/* header */\n.a  >  .b ,\n.c {\n  content: "x  /* y */  z";\n  margin: calc(1rem + 2px);\n}\n/*! keep */\nnav a:hover { color: red; }\n'
+
+    assert minify_css(css) == '.a>.b,.c{content:"x  /* y */  z";margin:calc(1rem + 2px)}/*! keep */ nav a:hover{color:red}'
+
+
+def test_minify_css_keeps_descendant_pseudo_class_space() -> None:
+    assert minify_css(".card :hover { color: red }") == ".card :hover{color:red}"
+
+
+def test_minify_html_collapses_whitespace_and_keeps_raw_blocks() -> None:
+    html = (
+        "<!doctype html>\n<html>\n  <!-- nav -->\n  <body>\n"
+        "    <a>one</a>   <a>two</a>\n"
+        "    <pre>  keep\n    this  </pre>\n"
+        "    <script>\n  if (a  <  b) {}\n</script>\n"
+        "    <style>\n  p { color: red; }\n</style>\n"
+        "    <!--[if IE]><p>old</p><![endif]-->\n"
+        "  </body>\n</html>\n"
+    )
+
+    assert minify_html(html) == (
+        "<!doctype html>\n<html>\n<body>\n<a>one</a> <a>two</a>\n"
+        "<pre>  keep\n    this  </pre>\n"
+        "<script>\n  if (a  <  b) {}\n</script>\n"
+        "<style>p{color:red}</style>\n"
+        "<!--[if IE]><p>old</p><![endif]-->\n</body>\n</html>\n"
+    )
+
+
+def test_write_minified_replaces_hardlinked_output_without_touching_source(tmp_path: Path) -> None:
+    source = tmp_path / "landing.css"
+    source.write_text("a {\n  color: red;\n}\n")
+    output = tmp_path / "out.css"
+    os.link(source, output)
+
+    size = write_minified(output, source.read_text())
+
+    assert output.read_text() == "a{color:red}"
+    assert source.read_text() == "a {\n  color: red;\n}\n"
+    assert (size.original, size.minified) == (20, 12)
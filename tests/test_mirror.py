@@ -0,0 +1,117 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from jarvis.compress import precompress
+from jarvis.mirror import MirrorMode, MirrorPlan, mirror_tree
+
+
+def _make_src(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    (src / "images").mkdir(parents=True)
+    (src / "index.html").write_text("<html></html>")
+    (src / "images" / "logo.png").write_bytes(b"\x89PNG")
+    return src
+
+
+@pytest.mark.parametrize("mode", list(MirrorMode))
+def test_mirror_copies_then_skips_unchanged_files(tmp_path: Path, mode: MirrorMode) -> None:
+    src = _make_src(tmp_path)
+    dst = tmp_path / "dst"
+
+    first = mirror_tree(src, dst, mode)
+    second = mirror_tree(src, dst, mode)
+
+    assert first.copied + first.linked == 2
+    assert second.skipped == 2
+    assert second.copied + second.linked == 0
+    assert (dst / "images" / "logo.png").read_bytes() == b"\x89PNG"
+
+
+def test_mirror_hardlinks_files(tmp_path: Path) -> None:
+    src = _make_src(tmp_path)
+    dst = tmp_path / "dst"
+
+    mirror_tree(src, dst, MirrorMode.HARDLINK)
+
+    assert os.path.samefile(src / "index.html", dst / "index.html")
+
+
+def test_mirror_transfers_changed_and_deletes_extraneous_files(tmp_path: Path) -> None:
+    src = _make_src(tmp_path)
+    dst = tmp_path / "dst"
+    mirror_tree(src, dst)
+    (dst / "stale").mkdir()
+    (dst / "stale" / "old.html").write_text("old")
+    (src / "index.html").write_text("<html>new</html>")
+
+    stats = mirror_tree(src, dst)
+
+    assert stats.copied == 1
+    assert stats.deleted == 2
+    assert (dst / "index.html").read_text() == "<html>new</html>"
+    assert not (dst / "stale").exists()
+
+
+def test_mirror_checksum_detects_same_size_changes(tmp_path: Path) -> None:
+    src = _make_src(tmp_path)
+    dst = tmp_path / "dst"
+    mirror_tree(src, dst)
+    (dst / "index.html").write_text("<HTML></HTML>")
+    st = (src / "index.html").stat()
+    os.utime(dst / "index.html", ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert mirror_tree(src, dst).copied == 0
+    assert mirror_tree(src, dst, checksum=True).copied == 1
+    assert (dst / "index.html").read_text() == "<html></html>"
+
+
+def test_mirror_plan_runs_transfers_in_parallel(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(20):
+        (src / f"f{i}.txt").write_text(str(i))
+    dst = tmp_path / "dst"
+
+    stats = mirror_tree(src, dst, jobs=4)
+
+    assert stats.copied == 20
+    assert stats.bytes == sum(len(str(i)) for i in range(20))
+    assert sorted(p.name for p in dst.iterdir()) == sorted(p.name for p in src.iterdir())
+    assert "mirrored 20 files" in stats.summary()
+
+
+def test_mirror_plan_add_files_renames_and_keeps_caller_written_files(tmp_path: Path) -> None:
+    src = _make_src(tmp_path)
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    (dst / "index.old.html").write_text("stale")
+    (dst / "manifest.json").write_text("{}")
+
+    plan = MirrorPlan()
+    plan.add_files(dst, [(src / "index.html", dst / "index.abc.html")], keep=[dst / "manifest.json"])
+    plan.execute(jobs=1)
+
+    assert sorted(p.name for p in dst.iterdir()) == ["index.abc.html", "manifest.json"]
+
+
+def test_mirror_keeps_precompressed_siblings_until_their_file_changes(tmp_path: Path) -> None:
+    src = _make_src(tmp_path)
+    (src / "index.html").write_text("<p>hello</p>\n" * 200)
+    dst = tmp_path / "dst"
+    mirror_tree(src, dst)
+    assert precompress(dst, jobs=1).files == 2
+
+    unchanged = mirror_tree(src, dst)
+
+    assert unchanged.deleted == 0
+    assert (dst / "index.html.gz").exists()
+    assert (dst / "index.html.br").exists()
+    assert precompress(dst, jobs=1).files == 0
+
+    (src / "index.html").write_text("<p>changed</p>\n" * 200)
+    mirror_tree(src, dst)
+
+    assert not (dst / "index.html.gz").exists()
+    assert precompress(dst, jobs=1).files == 2
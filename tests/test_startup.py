@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+from jarvis.startup import parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       459 |      47535 |   typer
+import time:       230 |       4101 |     concurrent.futures
+some unrelated warning
+import time:      3476 |     100812 | jarvis.main
+"""
+
+
+def test_parse_importtime_reads_timings_and_depth() -> None:
+    timings = parse_importtime(SAMPLE)
+
+    assert [(t.module, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+        ("typer", 459, 47535, 1),
+        ("concurrent.futures", 230, 4101, 2),
+        ("jarvis.main", 3476, 100812, 0),
+    ]
+
+
+def test_cli_import_does_not_load_writer_dependencies() -> None:
+    code = "import sys, jarvis.main; print(sorted(m for m in ('jinja2', 'markdown', 'mashumaro', 'loguru') if m in sys.modules))"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout  # noqa: S603
+
+    assert out.strip() == "[]"
@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from jarvis.about import AboutWriter
+from jarvis.landing import LandingWriter
+from jarvis.templating import get_environment
+
+
+def test_environment_is_shared_per_root_and_cache_dir(tmp_path: Path) -> None:
+    root = tmp_path / "templates"
+    (root / "page").mkdir(parents=True)
+    (root / "page" / "index.html.j2").write_text("{{ greeting | md }}")
+
+    env = get_environment(root, tmp_path / "cache")
+
+    assert get_environment(root, tmp_path / "cache") is env
+    assert env.get_template("page/index.html.j2").render(greeting="*hi*") == "<em>hi</em>"
+    assert list((tmp_path / "cache" / "jinja2").iterdir())
+
+
+def test_landing_and_about_writers_share_one_environment(tmp_path: Path) -> None:
+    about = AboutWriter(tmp_path / "about.md", tmp_path / "timeline.json", tmp_path, cache_dir=tmp_path / "cache")
+    landing = LandingWriter(tmp_path / "p.json", tmp_path / "p", tmp_path / "t.json", tmp_path / "n", tmp_path / "b", tmp_path, cache_dir=tmp_path / "cache")
+
+    assert about.env is landing.env
@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+
+from jarvis.watch import Watcher
+
+
+class FakeWriter:
+    def __init__(self, src: Path) -> None:
+        self.src = src
+        self.writes = 0
+
+    def inputs(self) -> list[Path]:
+        return [self.src]
+
+    def outputs(self) -> list[Path]:
+        return []
+
+    def write(self) -> None:
+        self.writes += 1
+
+
+class FakeGraphWriter(FakeWriter):
+    def __init__(self, src: Path, templates: Path) -> None:
+        super().__init__(src)
+        self.env = Environment(loader=FileSystemLoader(str(templates)), autoescape=True)
+        self.template_name = "page.j2"
+
+    def sources(self) -> list[Path]:
+        return [self.src]
+
+    def inputs(self) -> list[Path]:
+        raise AssertionError("the watcher expands sources() itself")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_watcher_reruns_only_the_affected_writer_after_debounce(tmp_path: Path) -> None:
+    (tmp_path / "a.md").write_text("a")
+    (tmp_path / "b.json").write_text("{}")
+    a, b = FakeWriter(tmp_path / "a.md"), FakeWriter(tmp_path / "b.json")
+    clock = FakeClock()
+    watcher = Watcher({"a": a, "b": b}, debounce=0.2, clock=clock)
+
+    (tmp_path / "a.md").write_text("a, edited")
+    assert watcher.poll() == {"a"}
+    assert watcher.flush() == []
+
+    clock.now = 0.5
+    assert watcher.flush() == ["a"]
+    assert (a.writes, b.writes) == (1, 0)
+    assert watcher.poll() == set()
+
+
+def test_watcher_detects_created_inputs(tmp_path: Path) -> None:
+    writer = FakeWriter(tmp_path / "later.md")
+    watcher = Watcher({"page": writer}, debounce=0.0)
+
+    writer.src.write_text("now it exists")
+
+    assert watcher.poll() == {"page"}
+    assert watcher.flush() == ["page"]
+
+
+def test_watcher_tracks_new_files_in_source_dirs_and_new_template_includes(tmp_path: Path) -> None:
+    (tmp_path / "posts" / "2024").mkdir(parents=True)
+    (tmp_path / "templates").mkdir()
+    page, part = tmp_path / "templates" / "page.j2", tmp_path / "templates" / "part.j2"
+    page.write_text("page")
+    part.write_text("part")
+    watcher = Watcher({"page": FakeGraphWriter(tmp_path / "posts", tmp_path / "templates")}, debounce=0.0)
+
+    assert watcher.poll() == set()
+    (tmp_path / "posts" / "2024" / "new.md").write_text("new")
+    assert watcher.poll() == {"page"}
+
+    page.write_text('{% include "part.j2" %}')
+    assert watcher.poll() == {"page"}
+    part.write_text("part, edited")
+    st = part.stat()
+    os.utime(part, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert watcher.poll() == {"page"}
@@ -1,7 +1,8 @@
 from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
-from jarvis.writing import _parse_frontmatter, scan_blogs
+from jarvis.writing import FrontmatterIndex, _parse_frontmatter, _parse_frontmatter_lines, iter_blogs, scan_blogs
 
 
 def test_parse_frontmatter_extracts_keys() -> None:
@@ -48,3 +49,66 @@ def test_scan_blogs_respects_limit(tmp_path: Path) -> None:
         (blogs / "2024" / f"post{i}.md").write_text(f"---\ntitle: Post {i}\ndate: 2024-0{i + 1}-01\ncategory: learning\n---\n")
 
     assert len(scan_blogs(blogs, limit=3)) == 3
+
+
+def test_parse_frontmatter_stops_consuming_at_closing_marker() -> None:
+    lines = iter(["---", "title: T", "---", "body line", "more body"])
+
+    assert _parse_frontmatter_lines(lines) == {"title": "T"}
+    assert next(lines) == "body line"
+
+
+def test_scan_blogs_serves_unchanged_posts_from_index(tmp_path: Path) -> None:
+    blogs = tmp_path / "blogs"
+    (blogs / "2024").mkdir(parents=True)
+    post = blogs / "2024" / "post.md"
+    post.write_text("---\ntitle: Post\ndate: 2024-01-01\ncategory: learning\n---\n")
+    index_file = tmp_path / "cache" / "frontmatter.json"
+    scan_blogs(blogs, index=FrontmatterIndex(index_file))
+
+    index = FrontmatterIndex(index_file)
+    with patch("jarvis.writing._read_frontmatter", side_effect=AssertionError("post was re-read")):
+        assert [e.title for e in scan_blogs(blogs, index=index)] == ["Post"]
+
+    post.write_text("---\ntitle: Renamed post\ndate: 2024-01-01\ncategory: learning\n---\n")
+    assert [e.title for e in scan_blogs(blogs, index=FrontmatterIndex(index_file))] == ["Renamed post"]
+
+
+def test_iter_blogs_yields_all_posts_newest_first(tmp_path: Path) -> None:
+    blogs = tmp_path / "blogs"
+    (blogs / "2024").mkdir(parents=True)
+    for i in (3, 1, 5, 2, 4):
+        (blogs / "2024" / f"post{i}.md").write_text(f"---\ntitle: Post {i}\ndate: 2024-0{i}-01\ncategory: learning\n---\n")
+
+    titles = [e.title for e in iter_blogs(blogs)]
+
+    assert titles == ["Post 5", "Post 4", "Post 3", "Post 2", "Post 1"]
+    assert [e.title for e in scan_blogs(blogs, limit=2)] == titles[:2]
+
+
+def test_parse_frontmatter_supports_yaml_lists_for_tags() -> None:
+    block = "---\ntitle: Lists\ntags:\n  - python\n  - build\naliases: [one, 'two']\n---\n"
+    flow = "---\ntitle: Lists\ntags: [python, 'build']\n---\n"
+    assert _parse_frontmatter(block) == {"title": "Lists", "tags": ["python", "build"], "aliases": "[one, 'two']"}
+    assert _parse_frontmatter(flow) == {"title": "Lists", "tags": ["python", "build"]}
+
+
+def test_parse_frontmatter_gives_up_past_size_cap() -> None:
+    text = "---\ntitle: Huge\n" + "x: y\n" * 20_000 + "---\n"
+    assert _parse_frontmatter(text) == {}
+
+
+def test_scan_blogs_exposes_tags(tmp_path: Path) -> None:
+    blogs = tmp_path / "blogs"
+    (blogs / "2024").mkdir(parents=True)
+    (blogs / "2024" / "a.md").write_text("---\ntags: python, build\ntitle: A\ndate: 2024-01-01\ncategory: learning\n---\n")
+
+    assert scan_blogs(blogs)[0].tags == ["python", "build"]
+
+
+def test_scan_blogs_keeps_bracketed_titles_as_text(tmp_path: Path) -> None:
+    blogs = tmp_path / "blogs"
+    (blogs / "2024").mkdir(parents=True)
+    (blogs / "2024" / "a.md").write_text("---\ntitle: [Draft]\ndate: 2024-01-01\ncategory: learning\n---\n")
+
+    assert [e.title for e in scan_blogs(blogs)] == ["[Draft]"]